@@ -4,19 +4,131 @@ Handles connections to all external APIs for autonomous marketing analysis
 """
 
 import os
+import copy
 import json
+import sqlite3
 import time
 import hashlib
-from typing import Dict, List, Optional, Any, Union
+import gzip
+import threading
+import concurrent.futures
+import functools
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
 import base64
 from pathlib import Path
-
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+from urllib.parse import urlsplit
+
+_ENV_LOADED = False
+
+def _load_env():
+    """Load the project .env once per process without overriding existing variables"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+
+    from dotenv import dotenv_values
+    for key, value in dotenv_values(Path(__file__).parent / ".env").items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    _ENV_LOADED = True
+
+# Optional AI provider SDKs
+try:
+    import anthropic
+    ANTHROPIC_AVAILABLE = True
+except ImportError:
+    ANTHROPIC_AVAILABLE = False
+
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+# Optional fast non-cryptographic hashing for cache keys
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _canonical_json(data: Any) -> bytes:
+    """Serialize data to sorted-key JSON bytes for hashing"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(data, sort_keys=True, default=str).encode()
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data to JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(data, default=str).encode()
+
+def _json_dumps_pretty(data: Any) -> str:
+    """Serialize data to indented JSON text for embedding in prompts"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+    return json.dumps(data, indent=2, default=str)
+
+def _json_loads(raw: Union[str, bytes]) -> Any:
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _new_hasher():
+    """Incremental 128-bit hasher shared by the cache-key helpers"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+def _hash128(data: Union[str, bytes]) -> str:
+    """128-bit hex digest for cache keys and parameters (xxh3, blake2b fallback)"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(data)
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+# Shared HTTP session so TCP/TLS connections are reused across API calls
+_HTTP = requests.Session()
+_HTTP.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+def _keywords_hash(keywords: List[str]) -> str:
+    """Order-independent hash of a keyword list, streamed into the hasher"""
+    h = _new_hasher()
+    for kw in sorted(set(keywords)):
+        h.update(kw.encode())
+        h.update(b'\x00')
+    return h.hexdigest()
+
+def _url_host(url: str) -> str:
+    """Host part of a URL as the caller wrote it, also for scheme-less input"""
+    return urlsplit(url).netloc or url.replace('https://', '').replace('http://', '').split('/')[0]
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_domain(url: str) -> str:
+    """Bare lowercase domain for a URL, so scheme/www/trailing-slash variants share cache entries"""
+    return _url_host(url).lower().removeprefix('www.')
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_url(url: str) -> str:
+    """Normalized domain plus path and query, for caching endpoints that work on a specific page"""
+    parts = urlsplit(url if '//' in url else f"//{url}")
+    normalized = _normalize_domain(url) + parts.path.rstrip('/')
+    return f"{normalized}?{parts.query}" if parts.query else normalized
 
 @dataclass
 class APIResponse:
@@ -27,113 +139,225 @@ class APIResponse:
     api_provider: Optional[str] = None
     cached: bool = False
 
+class _InFlight:
+    """A get_or_compute call in progress that other callers can wait on"""
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+# Cached payloads at least this large are stored gzip-compressed
+_COMPRESS_MIN_BYTES = 1024
+
 class CacheManager:
-    """Simple file-based cache for API responses"""
+    """SQLite-backed cache for API responses"""
 
-    def __init__(self, cache_dir: str = "cache", duration_hours: int = 24):
+    def __init__(self, cache_dir: str = "cache", duration_hours: Optional[int] = None, max_entries: int = 512,
+                 max_size_mb: int = 512):
+        _load_env()
+        if duration_hours is None:
+            duration_hours = int(os.getenv('CACHE_DURATION', '24'))
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.duration = timedelta(hours=duration_hours)
+        self.duration_s = duration_hours * 3600
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self._enabled = os.getenv('ENABLE_CACHING', 'true').lower() == 'true'
+
+        # In-process LRU of cache_key -> (expires_at_epoch, JSON bytes); hits are
+        # parsed afresh so callers never share (and mutate) one dict
+        self._mem = OrderedDict()
+        self._mem_lock = threading.Lock()
+        self.max_entries = max_entries
+
+        # cache_key -> _InFlight for computations currently running in get_or_compute
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+        # One persistent connection; WAL lets other processes read while we write
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_dir / "cache.db", check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts REAL NOT NULL, data BLOB NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_ts ON cache (ts)")
+
+        # Sweep expired/oversized entries once per process, off the hot path
+        if self._enabled:
+            threading.Thread(target=self.evict, daemon=True).start()
+
+    def evict(self):
+        """Delete expired entries, then the oldest ones until under max_size_bytes"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE ts < ?", (time.time() - self.duration_s,))
+            total_size = self._conn.execute("SELECT COALESCE(SUM(LENGTH(data)), 0) FROM cache").fetchone()[0]
+            if total_size <= self.max_size_bytes:
+                return
+
+            stale_keys = []
+            for key, size in self._conn.execute("SELECT key, LENGTH(data) FROM cache ORDER BY ts"):
+                stale_keys.append((key,))
+                total_size -= size
+                if total_size <= self.max_size_bytes:
+                    break
+            self._conn.executemany("DELETE FROM cache WHERE key = ?", stale_keys)
+
+    def set_enabled(self, enabled: bool):
+        """Toggle caching at runtime; ENABLE_CACHING is only read at construction"""
+        self._enabled = enabled
+        if not enabled:
+            with self._mem_lock:
+                self._mem.clear()
+
+    def close(self):
+        """Close the cache database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, cache_key: str, expires_at: float, payload: bytes):
+        """Store serialized entry in the in-process LRU, evicting the oldest if full"""
+        with self._mem_lock:
+            self._mem[cache_key] = (expires_at, payload)
+            self._mem.move_to_end(cache_key)
+            if len(self._mem) > self.max_entries:
+                self._mem.popitem(last=False)
 
     def get_cache_key(self, api_name: str, params: Dict) -> str:
         """Generate cache key from API name and parameters"""
-        cache_string = f"{api_name}_{json.dumps(params, sort_keys=True)}"
-        return hashlib.md5(cache_string.encode()).hexdigest()
+        h = _new_hasher()
+        h.update(api_name.encode())
+        h.update(b'\x1f')
+        h.update(_canonical_json(params))
+        return h.hexdigest()
 
     def get(self, api_name: str, params: Dict) -> Optional[Dict]:
         """Get cached response if available and not expired"""
-        if not os.getenv('ENABLE_CACHING', 'true').lower() == 'true':
+        if not self._enabled:
             return None
+        return self.get_by_key(self.get_cache_key(api_name, params))
 
-        cache_key = self.get_cache_key(api_name, params)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+    def get_by_key(self, cache_key: str, max_age_s: Optional[float] = None) -> Optional[Dict]:
+        """Get cached response for a precomputed cache key
 
-        if not cache_file.exists():
+        max_age_s optionally treats entries older than that many seconds as
+        misses, for data that goes stale sooner than the cache duration.
+        """
+        if not self._enabled:
             return None
 
+        # Hot path: in-process LRU
+        with self._mem_lock:
+            entry = self._mem.get(cache_key)
+            if entry is not None:
+                now = time.time()
+                if now < entry[0]:
+                    if max_age_s is not None and now - (entry[0] - self.duration_s) > max_age_s:
+                        return None
+                    self._mem.move_to_end(cache_key)
+                    return _json_loads(entry[1])
+                del self._mem[cache_key]
+
         try:
-            with open(cache_file, 'r') as f:
-                cached_data = json.load(f)
+            with self._lock:
+                row = self._conn.execute("SELECT ts, data FROM cache WHERE key = ?", (cache_key,)).fetchone()
+            if row is None:
+                return None
 
-            # Check expiration
-            cached_time = datetime.fromisoformat(cached_data['timestamp'])
-            if datetime.now() - cached_time > self.duration:
-                cache_file.unlink()  # Delete expired cache
+            cached_at, raw = row
+            if time.time() - cached_at > self.duration_s:
+                with self._lock:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (cache_key,))  # Delete expired cache
+                return None
+            if max_age_s is not None and time.time() - cached_at > max_age_s:
                 return None
 
-            return cached_data['data']
+            if raw[:2] == b"\x1f\x8b":
+                raw = gzip.decompress(raw)
+            self._remember(cache_key, cached_at + self.duration_s, raw)
+            return _json_loads(raw)
         except Exception:
             return None
 
+    def get_or_compute(self, cache_key: str, compute) -> Tuple[Dict, bool]:
+        """Return (data, cached) for cache_key, calling compute() on a miss.
+
+        Concurrent misses on the same key share one compute() call: the first
+        caller runs it and caches the result, the rest wait for it instead of
+        repeating the billable request. If compute() raises, every waiter gets
+        the same exception.
+        """
+        data = self.get_by_key(cache_key)
+        if data is not None:
+            return data, True
+
+        with self._inflight_lock:
+            flight = self._inflight.get(cache_key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[cache_key] = _InFlight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result), True
+
+        try:
+            # The previous leader may have stored the result between our miss and taking the lead
+            data = self.get_by_key(cache_key)
+            if data is not None:
+                flight.result = data
+                return data, True
+
+            flight.result = compute()
+            self.set_by_key(cache_key, flight.result)
+            return flight.result, False
+        except BaseException as e:
+            # Includes KeyboardInterrupt, so waiters never mistake an abort for a cached result
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+            flight.done.set()
+
     def set(self, api_name: str, params: Dict, data: Dict):
         """Cache API response"""
-        if not os.getenv('ENABLE_CACHING', 'true').lower() == 'true':
+        if not self._enabled:
             return
+        self.set_by_key(self.get_cache_key(api_name, params), data)
 
-        cache_key = self.get_cache_key(api_name, params)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
-        cached_data = {
-            'timestamp': datetime.now().isoformat(),
-            'data': data
-        }
+    def set_by_key(self, cache_key: str, data: Dict):
+        """Cache API response under a precomputed cache key"""
+        if not self._enabled:
+            return
 
+        now = time.time()
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(cached_data, f)
+            payload = _json_dumps(data)
+            self._remember(cache_key, now + self.duration_s, payload)
+            # LLM prose compresses well; level 1 keeps the CPU cost low
+            if len(payload) >= _COMPRESS_MIN_BYTES:
+                payload = gzip.compress(payload, compresslevel=1)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, ts, data) VALUES (?, ?, ?)",
+                    (cache_key, now, payload)
+                )
         except Exception as e:
             print(f"Cache write error: {e}")
 
 # Global cache manager
-cache = CacheManager(duration_hours=int(os.getenv('CACHE_DURATION', '24')))
-
-class AnthropicClient:
-    """Claude API client"""
-
-    def __init__(self):
-        self.api_key = os.getenv('ANTHROPIC_API_KEY')
-        self.base_url = "https://api.anthropic.com/v1"
-
-    def analyze_seo_data(self, website_url: str, seo_data: Dict, analysis_type: str = "comprehensive") -> APIResponse:
-        """Use Claude to analyze SEO data and provide insights"""
-        if not self.api_key:
-            return APIResponse(False, {}, "Anthropic API key not configured")
-
-        cache_params = {"website": website_url, "analysis_type": analysis_type, "data_hash": hashlib.md5(str(seo_data).encode()).hexdigest()[:10]}
-        cached_result = cache.get("anthropic_seo_analysis", cache_params)
-        if cached_result:
-            return APIResponse(True, cached_result, api_provider="anthropic", cached=True)
-
-        prompt = self._build_seo_analysis_prompt(website_url, seo_data, analysis_type)
-
-        try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=self.api_key)
-
-            response = client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=4000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            result = {
-                "analysis": response.content[0].text,
-                "timestamp": datetime.now().isoformat()
-            }
-
-            cache.set("anthropic_seo_analysis", cache_params, result)
-            return APIResponse(True, result, api_provider="anthropic")
-
-        except Exception as e:
-            return APIResponse(False, {}, f"Claude API error: {str(e)}")
+cache = CacheManager()
 
-    def _build_seo_analysis_prompt(self, website_url: str, seo_data: Dict, analysis_type: str) -> str:
-        """Build comprehensive SEO analysis prompt"""
-        return f"""
+# Static body of the Claude SEO analysis prompt
+_SEO_PROMPT_TMPL = """
 You are an expert SEO strategist analyzing website performance data. Provide a comprehensive analysis of {website_url}.
 
 SEO DATA TO ANALYZE:
-{json.dumps(seo_data, indent=2)}
+{seo_json}
 
 ANALYSIS TYPE: {analysis_type}
 
@@ -183,64 +407,116 @@ Format each action as:
 Make all recommendations specific, actionable, and data-driven based on the provided SEO data.
 """
 
-    def generate_content(self, prompt: str) -> APIResponse:
-        """Generate marketing content using Claude"""
-        if not self.api_key:
-            return APIResponse(False, {}, "Anthropic API key not configured")
+class AnthropicClient:
+    """Claude API client"""
 
-        # Create cache parameters based on prompt hash
-        cache_params = {"prompt_hash": hashlib.md5(prompt.encode()).hexdigest()[:16]}
-        cached_result = cache.get("anthropic_content_generation", cache_params)
-        if cached_result:
-            return APIResponse(True, cached_result, api_provider="anthropic", cached=True)
+    def __init__(self):
+        _load_env()
+        self.api_key = os.getenv('ANTHROPIC_API_KEY')
+        self.base_url = "https://api.anthropic.com/v1"
+        self._sdk = None
+        self._ok = bool(self.api_key) and ANTHROPIC_AVAILABLE
+        self._unconfigured_response = APIResponse(
+            False, {}, "Anthropic SDK not installed" if self.api_key else "Anthropic API key not configured")
+
+        # (data_hash, indented JSON) of the most recently prompted SEO data
+        self._last_seo_json = (None, "")
+
+    @property
+    def sdk(self):
+        """Anthropic SDK client, created on first use and reused afterwards"""
+        if self._sdk is None:
+            self._sdk = anthropic.Anthropic(api_key=self.api_key, max_retries=2, timeout=60.0)
+        return self._sdk
+
+    def close(self):
+        """Close the underlying SDK client and its connection pool"""
+        if self._sdk is not None:
+            self._sdk.close()
+            self._sdk = None
 
-        try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=self.api_key)
+    def analyze_seo_data(self, website_url: str, seo_data: Dict, analysis_type: str = "comprehensive") -> APIResponse:
+        """Use Claude to analyze SEO data and provide insights"""
+        if not self._ok:
+            return self._unconfigured_response
+
+        data_hash = _hash128(_canonical_json(seo_data))
+        cache_params = {"website": _normalize_domain(website_url), "analysis_type": analysis_type, "data_hash": data_hash}
+        cache_key = cache.get_cache_key("anthropic_seo_analysis", cache_params)
 
-            response = client.messages.create(
+        def request():
+            prompt = self._build_seo_analysis_prompt(website_url, seo_data, analysis_type, data_hash)
+
+            response = self.sdk.messages.create(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=4000,
                 messages=[{"role": "user", "content": prompt}]
             )
 
             result = {
-                "content": response.content[0].text,
+                "analysis": response.content[0].text,
                 "timestamp": datetime.now().isoformat()
             }
 
-            # Cache the result
-            cache.set("anthropic_content_generation", cache_params, result)
-            return APIResponse(True, result, api_provider="anthropic")
+            return result
+
+        try:
+            result, cached = cache.get_or_compute(cache_key, request)
+            return APIResponse(True, result, api_provider="anthropic", cached=cached)
 
         except Exception as e:
             return APIResponse(False, {}, f"Claude API error: {str(e)}")
 
-class OpenAIClient:
-    """ChatGPT API client"""
+    def _seo_json(self, seo_data: Dict, data_hash: Optional[str] = None) -> str:
+        """Indented JSON for seo_data, reused when the same data is prompted again"""
+        if data_hash is None:
+            data_hash = _hash128(_canonical_json(seo_data))
+        if self._last_seo_json[0] != data_hash:
+            self._last_seo_json = (data_hash, _json_dumps_pretty(seo_data))
+        return self._last_seo_json[1]
 
-    def __init__(self):
-        self.api_key = os.getenv('OPENAI_API_KEY')
+    def _build_seo_analysis_prompt(self, website_url: str, seo_data: Dict, analysis_type: str,
+                                   data_hash: Optional[str] = None) -> str:
+        """Build comprehensive SEO analysis prompt"""
+        return _SEO_PROMPT_TMPL.format(website_url=website_url, seo_json=self._seo_json(seo_data, data_hash),
+                                       analysis_type=analysis_type)
 
-    def analyze_content_opportunities(self, website_url: str, keyword_data: List[Dict]) -> APIResponse:
-        """Use ChatGPT for content strategy and opportunity analysis"""
-        if not self.api_key:
-            return APIResponse(False, {}, "OpenAI API key not configured")
+    def generate_content(self, prompt: str) -> APIResponse:
+        """Generate marketing content using Claude"""
+        if not self._ok:
+            return self._unconfigured_response
 
-        cache_params = {"website": website_url, "keywords": len(keyword_data)}
-        cached_result = cache.get("openai_content_analysis", cache_params)
-        if cached_result:
-            return APIResponse(True, cached_result, api_provider="openai", cached=True)
+        # Create cache parameters based on prompt hash
+        cache_params = {"prompt_hash": _hash128(prompt)}
+        cache_key = cache.get_cache_key("anthropic_content_generation", cache_params)
+
+        def request():
+            response = self.sdk.messages.create(
+                model="claude-3-5-sonnet-20241022",
+                max_tokens=4000,
+                messages=[{"role": "user", "content": prompt}]
+            )
+
+            result = {
+                "content": response.content[0].text,
+                "timestamp": datetime.now().isoformat()
+            }
+
+            return result
 
         try:
-            import openai
-            client = openai.OpenAI(api_key=self.api_key)
+            result, cached = cache.get_or_compute(cache_key, request)
+            return APIResponse(True, result, api_provider="anthropic", cached=cached)
+
+        except Exception as e:
+            return APIResponse(False, {}, f"Claude API error: {str(e)}")
 
-            prompt = f"""
+# Static body of the ChatGPT content opportunity prompt
+_CONTENT_PROMPT_TMPL = """
 Analyze content opportunities for {website_url} based on keyword research data:
 
 KEYWORD DATA:
-{json.dumps(keyword_data, indent=2)}
+{keyword_json}
 
 Provide:
 1. Content gaps analysis
@@ -250,7 +526,42 @@ Provide:
 5. Competitor content analysis insights
 """
 
-            response = client.chat.completions.create(
+class OpenAIClient:
+    """ChatGPT API client"""
+
+    def __init__(self):
+        _load_env()
+        self.api_key = os.getenv('OPENAI_API_KEY')
+        self._sdk = None
+        self._ok = bool(self.api_key) and OPENAI_AVAILABLE
+        self._unconfigured_response = APIResponse(
+            False, {}, "OpenAI SDK not installed" if self.api_key else "OpenAI API key not configured")
+
+    @property
+    def sdk(self):
+        """OpenAI SDK client, created on first use and reused afterwards"""
+        if self._sdk is None:
+            self._sdk = openai.OpenAI(api_key=self.api_key, max_retries=2, timeout=60.0)
+        return self._sdk
+
+    def close(self):
+        """Close the underlying SDK client and its connection pool"""
+        if self._sdk is not None:
+            self._sdk.close()
+            self._sdk = None
+
+    def analyze_content_opportunities(self, website_url: str, keyword_data: List[Dict]) -> APIResponse:
+        """Use ChatGPT for content strategy and opportunity analysis"""
+        if not self._ok:
+            return self._unconfigured_response
+
+        cache_params = {"website": _normalize_domain(website_url), "keywords": _hash128(_canonical_json(keyword_data))}
+        cache_key = cache.get_cache_key("openai_content_analysis", cache_params)
+
+        def request():
+            prompt = _CONTENT_PROMPT_TMPL.format(website_url=website_url, keyword_json=_json_dumps_pretty(keyword_data))
+
+            response = self.sdk.chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=3000
@@ -261,28 +572,26 @@ Provide:
                 "timestamp": datetime.now().isoformat()
             }
 
-            cache.set("openai_content_analysis", cache_params, result)
-            return APIResponse(True, result, api_provider="openai")
+            return result
+
+        try:
+            result, cached = cache.get_or_compute(cache_key, request)
+            return APIResponse(True, result, api_provider="openai", cached=cached)
 
         except Exception as e:
             return APIResponse(False, {}, f"OpenAI API error: {str(e)}")
 
     def generate_content(self, prompt: str) -> APIResponse:
         """Generate marketing content using OpenAI/ChatGPT"""
-        if not self.api_key:
-            return APIResponse(False, {}, "OpenAI API key not configured")
+        if not self._ok:
+            return self._unconfigured_response
 
         # Create cache parameters based on prompt hash
-        cache_params = {"prompt_hash": hashlib.md5(prompt.encode()).hexdigest()[:16]}
-        cached_result = cache.get("openai_content_generation", cache_params)
-        if cached_result:
-            return APIResponse(True, cached_result, api_provider="openai", cached=True)
-
-        try:
-            import openai
-            client = openai.OpenAI(api_key=self.api_key)
+        cache_params = {"prompt_hash": _hash128(prompt)}
+        cache_key = cache.get_cache_key("openai_content_generation", cache_params)
 
-            response = client.chat.completions.create(
+        def request():
+            response = self.sdk.chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=4000
@@ -293,36 +602,17 @@ Provide:
                 "timestamp": datetime.now().isoformat()
             }
 
-            # Cache the result
-            cache.set("openai_content_generation", cache_params, result)
-            return APIResponse(True, result, api_provider="openai")
+            return result
+
+        try:
+            result, cached = cache.get_or_compute(cache_key, request)
+            return APIResponse(True, result, api_provider="openai", cached=cached)
 
         except Exception as e:
             return APIResponse(False, {}, f"OpenAI API error: {str(e)}")
 
-class PerplexityClient:
-    """Perplexity API client for real-time competitive analysis"""
-
-    def __init__(self):
-        self.api_key = os.getenv('PERPLEXITY_API_KEY')
-
-    def analyze_competitors(self, website_url: str, industry: str) -> APIResponse:
-        """Use Perplexity for real-time competitive analysis"""
-        if not self.api_key:
-            return APIResponse(False, {}, "Perplexity API key not configured")
-
-        cache_params = {"website": website_url, "industry": industry}
-        cached_result = cache.get("perplexity_competitor_analysis", cache_params)
-        if cached_result:
-            return APIResponse(True, cached_result, api_provider="perplexity", cached=True)
-
-        try:
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-
-            prompt = f"""
+# Static body of the Perplexity competitor analysis prompt
+_COMPETITOR_PROMPT_TMPL = """
 Analyze the competitive landscape for {website_url} in the {industry} industry. Provide:
 
 1. Top 5 direct competitors with their strengths/weaknesses
@@ -335,14 +625,123 @@ Analyze the competitive landscape for {website_url} in the {industry} industry.
 Focus on actionable competitive insights for SEO and marketing strategy.
 """
 
-            response = requests.post(
+# Market research prompt templates, formatted with the research subject
+_RESEARCH_PROMPT_TEMPLATES = {
+    "competitive": """
+    Conduct a comprehensive competitive analysis for {subject}. Provide current, actionable intelligence on:
+    1. Top 5 direct competitors with recent market moves and changes
+    2. Current pricing strategies and recent pricing changes
+    3. Latest marketing campaigns and messaging strategies
+    4. Recent product launches, partnerships, or strategic moves
+    5. Market share changes and competitive positioning shifts
+    6. SEO and content marketing strategies comparison
+    7. Social media presence and engagement analysis
+    8. Customer review sentiment and recent feedback trends
+    9. Emerging competitive threats and new market entrants
+    10. Strategic recommendations for competitive advantage
+
+    Focus on actionable, recent intelligence (within last 6 months) with specific examples and data points.
+    """,
+
+    "market": """
+    Analyze the current market landscape for {subject}. Provide comprehensive market intelligence on:
+    1. Market size, growth rate, and recent market dynamics
+    2. Current industry trends and emerging opportunities
+    3. Customer behavior shifts and changing preferences
+    4. Technology disruptions and innovation trends
+    5. Regulatory changes and compliance requirements
+    6. Economic factors affecting market conditions
+    7. Geographic market variations and expansion opportunities
+    8. Seasonal patterns and cyclical trends
+    9. Investment activity and funding trends in the space
+    10. Future market predictions and growth forecasts
+
+    Include specific data, recent studies, and actionable market insights.
+    """,
+
+    "audience": """
+    Research the target audience for {subject}. Provide detailed audience intelligence on:
+    1. Demographics and psychographic profiles with recent data
+    2. Current consumer behavior patterns and purchasing trends
+    3. Pain points, challenges, and unmet needs analysis
+    4. Preferred communication channels and media consumption habits
+    5. Social media behavior and platform preferences
+    6. Search behavior, keywords used, and information seeking patterns
+    7. Brand loyalty patterns and switching behavior
+    8. Price sensitivity and value perception analysis
+    9. Influence factors in decision making process
+    10. Recent surveys, studies, and consumer sentiment data
+
+    Focus on actionable insights for marketing and product strategy.
+    """,
+
+    "keyword": """
+    Conduct keyword and search trend research for {subject}. Provide intelligence on:
+    1. High-volume, high-intent keywords with search trends
+    2. Emerging search terms and trending queries
+    3. Long-tail keyword opportunities with low competition
+    4. Search intent analysis (informational, commercial, transactional)
+    5. Seasonal keyword trends and cyclical patterns
+    6. Geographic variations in search behavior
+    7. Related topics and semantic keyword clusters
+    8. Question-based keywords and voice search trends
+    9. Competitor keyword strategies and gaps
+    10. Content opportunities based on search demand
+
+    Include specific search volume data and trend analysis where available.
+    """,
+
+    "industry": """
+    Analyze the {subject} industry with comprehensive intelligence on:
+    1. Industry size, growth trajectory, and market maturity
+    2. Key trends, disruptions, and transformation drivers
+    3. Major players, market consolidation, and competitive landscape
+    4. Innovation trends, emerging technologies, and R&D focus
+    5. Regulatory environment and compliance challenges
+    6. Supply chain dynamics and operational considerations
+    7. Investment patterns, M&A activity, and funding trends
+    8. Customer expectations evolution and service standards
+    9. Sustainability trends and environmental considerations
+    10. Future industry outlook and strategic recommendations
+
+    Provide strategic-level insights with supporting data and examples.
+    """
+}
+
+class PerplexityClient:
+    """Perplexity API client for real-time competitive analysis"""
+
+    def __init__(self):
+        _load_env()
+        self.api_key = os.getenv('PERPLEXITY_API_KEY')
+        self._ok = bool(self.api_key)
+        self._unconfigured_response = APIResponse(False, {}, "Perplexity API key not configured")
+        self._session = _HTTP
+        self._headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
+
+    def analyze_competitors(self, website_url: str, industry: str) -> APIResponse:
+        """Use Perplexity for real-time competitive analysis"""
+        if not self._ok:
+            return self._unconfigured_response
+
+        cache_params = {"website": _normalize_url(website_url), "industry": industry}
+        cache_key = cache.get_cache_key("perplexity_competitor_analysis", cache_params)
+
+        def request():
+            prompt = _COMPETITOR_PROMPT_TMPL.format(website_url=website_url, industry=industry)
+
+            response = self._session.post(
                 'https://api.perplexity.ai/chat/completions',
-                headers=headers,
+                headers=self._headers,
                 json={
                     "model": "llama-3.1-sonar-large-128k-online",
                     "messages": [{"role": "user", "content": prompt}],
                     "max_tokens": 3000
-                }
+                },
+                timeout=60
             )
 
             response.raise_for_status()
@@ -353,121 +752,36 @@ Focus on actionable competitive insights for SEO and marketing strategy.
                 "timestamp": datetime.now().isoformat()
             }
 
-            cache.set("perplexity_competitor_analysis", cache_params, result)
-            return APIResponse(True, result, api_provider="perplexity")
+            return result
+
+        try:
+            result, cached = cache.get_or_compute(cache_key, request)
+            return APIResponse(True, result, api_provider="perplexity", cached=cached)
 
         except Exception as e:
             return APIResponse(False, {}, f"Perplexity API error: {str(e)}")
 
     def conduct_market_research(self, target_subject: str, research_type: str, depth: str = "standard") -> APIResponse:
         """Conduct real-time market research using Perplexity"""
-        if not self.api_key:
-            return APIResponse(False, {}, "Perplexity API key not configured")
+        if not self._ok:
+            return self._unconfigured_response
 
         cache_params = {"subject": target_subject, "type": research_type, "depth": depth}
-        cached_result = cache.get("perplexity_market_research", cache_params)
-        if cached_result:
-            return APIResponse(True, cached_result, api_provider="perplexity", cached=True)
-
-        # Build research prompt based on type
-        research_prompts = {
-            "competitive": f"""
-            Conduct a comprehensive competitive analysis for {target_subject}. Provide current, actionable intelligence on:
-            1. Top 5 direct competitors with recent market moves and changes
-            2. Current pricing strategies and recent pricing changes
-            3. Latest marketing campaigns and messaging strategies
-            4. Recent product launches, partnerships, or strategic moves
-            5. Market share changes and competitive positioning shifts
-            6. SEO and content marketing strategies comparison
-            7. Social media presence and engagement analysis
-            8. Customer review sentiment and recent feedback trends
-            9. Emerging competitive threats and new market entrants
-            10. Strategic recommendations for competitive advantage
-
-            Focus on actionable, recent intelligence (within last 6 months) with specific examples and data points.
-            """,
-
-            "market": f"""
-            Analyze the current market landscape for {target_subject}. Provide comprehensive market intelligence on:
-            1. Market size, growth rate, and recent market dynamics
-            2. Current industry trends and emerging opportunities
-            3. Customer behavior shifts and changing preferences
-            4. Technology disruptions and innovation trends
-            5. Regulatory changes and compliance requirements
-            6. Economic factors affecting market conditions
-            7. Geographic market variations and expansion opportunities
-            8. Seasonal patterns and cyclical trends
-            9. Investment activity and funding trends in the space
-            10. Future market predictions and growth forecasts
-
-            Include specific data, recent studies, and actionable market insights.
-            """,
-
-            "audience": f"""
-            Research the target audience for {target_subject}. Provide detailed audience intelligence on:
-            1. Demographics and psychographic profiles with recent data
-            2. Current consumer behavior patterns and purchasing trends
-            3. Pain points, challenges, and unmet needs analysis
-            4. Preferred communication channels and media consumption habits
-            5. Social media behavior and platform preferences
-            6. Search behavior, keywords used, and information seeking patterns
-            7. Brand loyalty patterns and switching behavior
-            8. Price sensitivity and value perception analysis
-            9. Influence factors in decision making process
-            10. Recent surveys, studies, and consumer sentiment data
-
-            Focus on actionable insights for marketing and product strategy.
-            """,
-
-            "keyword": f"""
-            Conduct keyword and search trend research for {target_subject}. Provide intelligence on:
-            1. High-volume, high-intent keywords with search trends
-            2. Emerging search terms and trending queries
-            3. Long-tail keyword opportunities with low competition
-            4. Search intent analysis (informational, commercial, transactional)
-            5. Seasonal keyword trends and cyclical patterns
-            6. Geographic variations in search behavior
-            7. Related topics and semantic keyword clusters
-            8. Question-based keywords and voice search trends
-            9. Competitor keyword strategies and gaps
-            10. Content opportunities based on search demand
-
-            Include specific search volume data and trend analysis where available.
-            """,
-
-            "industry": f"""
-            Analyze the {target_subject} industry with comprehensive intelligence on:
-            1. Industry size, growth trajectory, and market maturity
-            2. Key trends, disruptions, and transformation drivers
-            3. Major players, market consolidation, and competitive landscape
-            4. Innovation trends, emerging technologies, and R&D focus
-            5. Regulatory environment and compliance challenges
-            6. Supply chain dynamics and operational considerations
-            7. Investment patterns, M&A activity, and funding trends
-            8. Customer expectations evolution and service standards
-            9. Sustainability trends and environmental considerations
-            10. Future industry outlook and strategic recommendations
-
-            Provide strategic-level insights with supporting data and examples.
-            """
-        }
+        cache_key = cache.get_cache_key("perplexity_market_research", cache_params)
 
-        prompt = research_prompts.get(research_type, research_prompts["competitive"])
-
-        try:
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
+        def request():
+            template = _RESEARCH_PROMPT_TEMPLATES.get(research_type, _RESEARCH_PROMPT_TEMPLATES["competitive"])
+            prompt = template.format(subject=target_subject)
 
-            response = requests.post(
+            response = self._session.post(
                 'https://api.perplexity.ai/chat/completions',
-                headers=headers,
+                headers=self._headers,
                 json={
                     "model": "llama-3.1-sonar-large-128k-online",
                     "messages": [{"role": "user", "content": prompt}],
                     "max_tokens": 4000
-                }
+                },
+                timeout=60
             )
 
             response.raise_for_status()
@@ -482,8 +796,11 @@ Focus on actionable competitive insights for SEO and marketing strategy.
                 "sources": "Real-time web intelligence via Perplexity AI"
             }
 
-            cache.set("perplexity_market_research", cache_params, result)
-            return APIResponse(True, result, api_provider="perplexity")
+            return result
+
+        try:
+            result, cached = cache.get_or_compute(cache_key, request)
+            return APIResponse(True, result, api_provider="perplexity", cached=cached)
 
         except Exception as e:
             return APIResponse(False, {}, f"Perplexity research API error: {str(e)}")
@@ -492,67 +809,118 @@ class DataForSEOClient:
     """DataForSEO API client for comprehensive SEO data"""
 
     def __init__(self):
+        _load_env()
         self.login = os.getenv('DATAFORSEO_LOGIN')
         self.password = os.getenv('DATAFORSEO_PASSWORD')
+        self._ok = bool(self.login and self.password)
+        self._unconfigured_response = APIResponse(False, {}, "DataForSEO credentials not configured")
         self.base_url = "https://api.dataforseo.com/v3"
-
-    def _make_request(self, endpoint: str, data: List[Dict]) -> Dict:
-        """Make authenticated request to DataForSEO API"""
-        auth = base64.b64encode(f"{self.login}:{self.password}".encode()).decode()
-        headers = {
-            'Authorization': f'Basic {auth}',
+        self._session = _HTTP
+        self._auth_header = 'Basic ' + base64.b64encode(f"{self.login}:{self.password}".encode()).decode() if self._ok else None
+        self._headers = {
+            'Authorization': self._auth_header,
             'Content-Type': 'application/json'
         }
 
-        response = requests.post(f"{self.base_url}/{endpoint}", headers=headers, json=data)
+    def _make_request(self, endpoint: str, data: List[Dict]) -> Dict:
+        """Make authenticated request to DataForSEO API"""
+        response = self._session.post(f"{self.base_url}/{endpoint}", headers=self._headers, json=data, timeout=60)
         response.raise_for_status()
         return response.json()
 
+    @staticmethod
+    def _split_tasks(response: Dict) -> Dict[str, Dict]:
+        """Split a multi-task DataForSEO response into one response per task, keyed by the echoed target"""
+        split = {}
+        for task in response.get("tasks") or []:
+            target = (task.get("data") or {}).get("target")
+            if target is not None:
+                split[target] = {**response, "tasks_count": 1, "tasks": [task]}
+        return split
+
     def get_domain_analysis(self, website_url: str) -> APIResponse:
         """Get comprehensive domain analysis including backlinks, organic traffic, etc."""
-        if not self.login or not self.password:
-            return APIResponse(False, {}, "DataForSEO credentials not configured")
-
-        domain = website_url.replace('https://', '').replace('http://', '').split('/')[0]
-        cache_params = {"domain": domain, "analysis": "comprehensive"}
-        cached_result = cache.get("dataforseo_domain_analysis", cache_params)
-        if cached_result:
-            return APIResponse(True, cached_result, api_provider="dataforseo", cached=True)
+        batch = self.get_domain_analysis_batch([website_url])
+        if not batch.success:
+            return batch
+
+        result = next(iter(batch.data.values()))
+        return APIResponse(True, result, api_provider="dataforseo", cached=batch.cached)
+
+    def get_domain_analysis_batch(self, website_urls: List[str]) -> APIResponse:
+        """Get domain analysis for several sites, one POST per endpoint for all uncached domains"""
+        if not self._ok:
+            return self._unconfigured_response
+
+        results = {}
+        missing = {}
+        targets = {}
+        for website_url in website_urls:
+            domain = _normalize_domain(website_url)
+            cache_key = cache.get_cache_key("dataforseo_domain_analysis", {"domain": domain, "analysis": "comprehensive"})
+            cached_result = cache.get_by_key(cache_key)
+            if cached_result:
+                results[domain] = cached_result
+            else:
+                results[domain] = None
+                missing[domain] = cache_key
+                # DataForSEO still gets the host as the caller wrote it; only the cache key is normalized
+                targets.setdefault(domain, _url_host(website_url))
+
+        if not missing:
+            return APIResponse(True, results, api_provider="dataforseo", cached=True)
 
         try:
-            # Get domain overview
-            domain_data = self._make_request("domain_analytics/overview/live", [{
-                "target": domain,
-                "location_code": 2840,  # USA
-                "language_code": "en"
-            }])
-
-            # Get backlink data
-            backlink_data = self._make_request("backlinks/summary/live", [{
-                "target": domain,
-                "internal_list_limit": 10,
-                "backlinks_status_type": "live"
-            }])
-
-            result = {
-                "domain_overview": domain_data,
-                "backlink_summary": backlink_data,
-                "timestamp": datetime.now().isoformat()
-            }
+            domains = list(missing)
+            # DataForSEO takes a list of tasks per POST, so every uncached domain
+            # shares one round-trip per endpoint; the two endpoints overlap
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                domain_future = executor.submit(self._make_request, "domain_analytics/overview/live", [{
+                    "target": targets[domain],
+                    "location_code": 2840,  # USA
+                    "language_code": "en"
+                } for domain in domains])
+                backlink_future = executor.submit(self._make_request, "backlinks/summary/live", [{
+                    "target": targets[domain],
+                    "internal_list_limit": 10,
+                    "backlinks_status_type": "live"
+                } for domain in domains])
+
+                domain_data = self._split_tasks(domain_future.result())
+                backlink_data = self._split_tasks(backlink_future.result())
+
+            timestamp = datetime.now().isoformat()
+            failed = []
+            for domain in domains:
+                target = targets[domain]
+                if target not in domain_data or target not in backlink_data:
+                    # No task came back for this target; leave it uncached so the next call retries
+                    failed.append(domain)
+                    continue
+                result = {
+                    "domain_overview": domain_data[target],
+                    "backlink_summary": backlink_data[target],
+                    "timestamp": timestamp
+                }
+                cache.set_by_key(missing[domain], result)
+                results[domain] = result
 
-            cache.set("dataforseo_domain_analysis", cache_params, result)
-            return APIResponse(True, result, api_provider="dataforseo")
+            error = f"DataForSEO returned no task for: {', '.join(failed)}" if failed else None
+            if len(failed) == len(results):
+                return APIResponse(False, {}, error, api_provider="dataforseo")
+            return APIResponse(True, results, error, api_provider="dataforseo")
 
         except Exception as e:
             return APIResponse(False, {}, f"DataForSEO API error: {str(e)}")
 
     def get_on_page_audit(self, website_url: str) -> APIResponse:
         """Get technical SEO audit data"""
-        if not self.login or not self.password:
-            return APIResponse(False, {}, "DataForSEO credentials not configured")
+        if not self._ok:
+            return self._unconfigured_response
 
-        cache_params = {"url": website_url, "audit": "technical"}
-        cached_result = cache.get("dataforseo_onpage_audit", cache_params)
+        cache_params = {"url": _normalize_url(website_url), "audit": "technical"}
+        cache_key = cache.get_cache_key("dataforseo_onpage_audit", cache_params)
+        cached_result = cache.get_by_key(cache_key)
         if cached_result:
             return APIResponse(True, cached_result, api_provider="dataforseo", cached=True)
 
@@ -574,7 +942,7 @@ class DataForSEOClient:
                 "timestamp": datetime.now().isoformat()
             }
 
-            cache.set("dataforseo_onpage_audit", cache_params, result)
+            cache.set_by_key(cache_key, result)
             return APIResponse(True, result, api_provider="dataforseo")
 
         except Exception as e:
@@ -584,32 +952,36 @@ class KeywordsEverywhereClient:
     """Keywords Everywhere API client"""
 
     def __init__(self):
+        _load_env()
         self.api_key = os.getenv('KEYWORDS_EVERYWHERE_API_KEY')
+        self._ok = bool(self.api_key)
+        self._unconfigured_response = APIResponse(False, {}, "Keywords Everywhere API key not configured")
         self.base_url = "https://api.keywordseverywhere.com/v1"
+        self._session = _HTTP
+        self._headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
 
     def get_keyword_data(self, keywords: List[str], country: str = "US") -> APIResponse:
         """Get search volume and CPC data for keywords"""
-        if not self.api_key:
-            return APIResponse(False, {}, "Keywords Everywhere API key not configured")
+        if not self._ok:
+            return self._unconfigured_response
 
-        cache_params = {"keywords": sorted(keywords), "country": country}
-        cached_result = cache.get("keywords_everywhere_data", cache_params)
+        cache_params = {"kw_hash": _keywords_hash(keywords), "country": country}
+        cache_key = cache.get_cache_key("keywords_everywhere_data", cache_params)
+        cached_result = cache.get_by_key(cache_key)
         if cached_result:
             return APIResponse(True, cached_result, api_provider="keywords_everywhere", cached=True)
 
         try:
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-
             data = {
                 "kw": keywords,
                 "country": country,
                 "currency": "USD"
             }
 
-            response = requests.post(f"{self.base_url}/get_keyword_data", headers=headers, json=data)
+            response = self._session.post(f"{self.base_url}/get_keyword_data", headers=self._headers, json=data, timeout=60)
             response.raise_for_status()
             result_data = response.json()
 
@@ -619,7 +991,7 @@ class KeywordsEverywhereClient:
                 "timestamp": datetime.now().isoformat()
             }
 
-            cache.set("keywords_everywhere_data", cache_params, result)
+            cache.set_by_key(cache_key, result)
             return APIResponse(True, result, api_provider="keywords_everywhere")
 
         except Exception as e:
@@ -627,27 +999,23 @@ class KeywordsEverywhereClient:
 
     def get_related_keywords(self, seed_keyword: str, country: str = "US") -> APIResponse:
         """Get related keywords and search volume data"""
-        if not self.api_key:
-            return APIResponse(False, {}, "Keywords Everywhere API key not configured")
+        if not self._ok:
+            return self._unconfigured_response
 
         cache_params = {"seed": seed_keyword, "country": country, "type": "related"}
-        cached_result = cache.get("keywords_everywhere_related", cache_params)
+        cache_key = cache.get_cache_key("keywords_everywhere_related", cache_params)
+        cached_result = cache.get_by_key(cache_key)
         if cached_result:
             return APIResponse(True, cached_result, api_provider="keywords_everywhere", cached=True)
 
         try:
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-
             data = {
                 "kw": seed_keyword,
                 "country": country,
                 "currency": "USD"
             }
 
-            response = requests.post(f"{self.base_url}/get_related_keywords", headers=headers, json=data)
+            response = self._session.post(f"{self.base_url}/get_related_keywords", headers=self._headers, json=data, timeout=60)
             response.raise_for_status()
             result_data = response.json()
 
@@ -657,12 +1025,14 @@ class KeywordsEverywhereClient:
                 "timestamp": datetime.now().isoformat()
             }
 
-            cache.set("keywords_everywhere_related", cache_params, result)
+            cache.set_by_key(cache_key, result)
             return APIResponse(True, result, api_provider="keywords_everywhere")
 
         except Exception as e:
             return APIResponse(False, {}, f"Keywords Everywhere API error: {str(e)}")
 
+DEFAULT_AI_PROVIDER = os.getenv('DEFAULT_AI_PROVIDER', 'anthropic')
+
 # Initialize all clients
 anthropic_client = AnthropicClient()
 openai_client = OpenAIClient()
@@ -670,15 +1040,43 @@ perplexity_client = PerplexityClient()
 dataforseo_client = DataForSEOClient()
 keywords_everywhere_client = KeywordsEverywhereClient()
 
+_AI_CLIENTS = {
+    'anthropic': anthropic_client,
+    'openai': openai_client,
+    'perplexity': perplexity_client
+}
+
 def get_ai_client(provider: str = None):
     """Get AI client based on provider preference or default"""
-    if not provider:
-        provider = os.getenv('DEFAULT_AI_PROVIDER', 'anthropic')
-
-    clients = {
-        'anthropic': anthropic_client,
-        'openai': openai_client,
-        'perplexity': perplexity_client
-    }
-
-    return clients.get(provider, anthropic_client)
\ No newline at end of file
+    return _AI_CLIENTS.get(provider or DEFAULT_AI_PROVIDER, anthropic_client)
+
+def get_http_session() -> requests.Session:
+    """Shared pooled HTTP session for outbound requests outside the API clients"""
+    return _HTTP
+
+def run_all(website_url: str, seo_data: Optional[Dict] = None, keyword_data: Optional[List[Dict]] = None,
+            industry: Optional[str] = None, keywords: Optional[List[str]] = None) -> Dict[str, APIResponse]:
+    """Query every provider that has inputs for website_url concurrently.
+
+    The calls are network-bound and independent, so wall time is the slowest
+    provider rather than the sum of all of them. Returns provider -> APIResponse.
+    """
+    calls = {"dataforseo": (dataforseo_client.get_domain_analysis, website_url)}
+    if seo_data is not None:
+        calls["anthropic"] = (anthropic_client.analyze_seo_data, website_url, seo_data)
+    if keyword_data is not None:
+        calls["openai"] = (openai_client.analyze_content_opportunities, website_url, keyword_data)
+    if industry:
+        calls["perplexity"] = (perplexity_client.analyze_competitors, website_url, industry)
+    if keywords:
+        calls["keywords_everywhere"] = (keywords_everywhere_client.get_keyword_data, keywords)
+
+    results = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = {name: executor.submit(fn, *args) for name, (fn, *args) in calls.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = APIResponse(False, {}, f"{name} error: {str(e)}", api_provider=name)
+    return results
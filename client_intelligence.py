@@ -13,32 +13,214 @@ Features:
 
 import os
 import sqlite3
+import concurrent.futures
+import threading
 import json
+import re
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 import hashlib
-
-# Import our existing tools
-from seo_analysis_engine import analyze_website_seo
-from python_scripts.marketing_agents.research_strategist import AutonomousResearchEngine
-from api_clients import get_ai_client
+import functools
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Our analysis tools (and the AI SDKs behind them) are imported on first use
+# so read-only callers like list_clients/get_client_profile don't load them
+
+# How long a parsed AI business-intelligence response is reused for the same prompt
+AI_CACHE_TTL_DAYS = 7
+
+def _json_dumps(data) -> str:
+    """Compact JSON text, via orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+    return json.dumps(data, default=str)
+
+def _json_loads(raw):
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _json_excerpt(data, budget: int) -> str:
+    """First budget chars of data's JSON, serializing dict entries only until the budget is spent"""
+    if not isinstance(data, dict):
+        return _json_dumps(data)[:budget]
+
+    parts, size = [], 1
+    for key, value in data.items():
+        part = f"{_json_dumps(str(key))}:{_json_dumps(value)}"
+        parts.append(part)
+        size += len(part) + 1
+        if size >= budget:
+            break
+    return ("{" + ",".join(parts) + "}")[:budget]
+
+# Per-run fields (wall-clock stamps, timings) that would change the prompt on every call
+_VOLATILE_KEYS = frozenset({"timestamp", "analysis_time", "analysis_duration", "load_time"})
+
+def _without_volatile(data):
+    """Copy of data with _VOLATILE_KEYS removed at every nesting level"""
+    if isinstance(data, dict):
+        return {key: _without_volatile(value) for key, value in data.items() if key not in _VOLATILE_KEYS}
+    if isinstance(data, list):
+        return [_without_volatile(item) for item in data]
+    return data
+
+def _display_domain(website_url: str) -> str:
+    """Host part of a client URL, shown in place of the full URL"""
+    return urlparse(website_url).netloc or website_url.split("/")[0]
+
+def _is_software(business_type: str) -> bool:
+    """Whether a lowercased business type describes a SaaS/software company"""
+    return "saas" in business_type or "software" in business_type
+
+# Fixed recommendations keyed by a predicate over (lowercased business_type, profile)
+_RECOMMENDATION_RULES: Tuple[Tuple[Callable[[str, Dict], bool], Dict], ...] = (
+    # Content recommendations based on business type
+    (lambda bt, profile: _is_software(bt), {
+        "type": "content_strategy",
+        "title": "SaaS Content Marketing Strategy",
+        "description": "Create educational content, case studies, and free tools to attract prospects.",
+        "priority": 2,
+        "estimated_impact": "Medium"
+    }),
+    (lambda bt, profile: not _is_software(bt) and ("local" in bt or "service" in bt), {
+        "type": "local_seo",
+        "title": "Local SEO Optimization",
+        "description": "Focus on Google My Business, local keywords, and location-based content.",
+        "priority": 1,
+        "estimated_impact": "High"
+    }),
+    # Marketing maturity recommendations
+    (lambda bt, profile: profile.get("marketing_maturity") == "Beginner", {
+        "type": "foundation",
+        "title": "Marketing Foundation Setup",
+        "description": "Establish basic marketing infrastructure: analytics, email marketing, social presence.",
+        "priority": 1,
+        "estimated_impact": "High"
+    }),
+    # Growth stage recommendations
+    (lambda bt, profile: profile.get("growth_stage") == "Early", {
+        "type": "growth_strategy",
+        "title": "Growth Stage Marketing",
+        "description": "Focus on customer acquisition and retention strategies.",
+        "priority": 2,
+        "estimated_impact": "Medium"
+    }),
+)
+
+# Characters that matter when scanning for a balanced JSON object
+_JSON_SCAN_RE = re.compile(r'[{}"\\]')
+
+def _first_json_object(text: str) -> Optional[str]:
+    """Span of the first brace-balanced {...} in text, ignoring braces inside JSON strings"""
+    start = text.find('{')
+    if start < 0:
+        return None
+
+    depth, in_string, skip_to = 0, False, start
+    for match in _JSON_SCAN_RE.finditer(text, start):
+        pos = match.start()
+        if pos < skip_to:
+            continue  # escaped character
+        char = match.group()
+        if in_string:
+            if char == '\\':
+                skip_to = pos + 2
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:pos + 1]
+    return None
+
+# Static body of the AI business-intelligence prompt
+_BI_PROMPT_TMPL = """
+Analyze this business data and extract key intelligence:
+
+WEBSITE: {website_url}
+
+SEO DATA:
+- SEO Score: {seo_score}
+- Technical Data: {technical_json}
+
+MARKET RESEARCH:
+{market_json}
+
+Extract and return the following business intelligence as JSON:
+{{
+    "industry": "specific industry category",
+    "business_type": "e.g., B2B, B2C, SaaS, Local Service, E-commerce",
+    "company_size": "Startup, Small, Medium, or Enterprise",
+    "target_audience": "detailed description of primary audience",
+    "value_proposition": "main value they provide",
+    "primary_goals": "likely marketing/business goals",
+    "competitive_advantage": "what sets them apart",
+    "growth_stage": "Early, Growth, Mature, or Declining",
+    "marketing_maturity": "Beginner, Intermediate, Advanced",
+    "recommended_brand_tone": "professional, casual, friendly, or authoritative",
+    "key_challenges": ["list", "of", "challenges"],
+    "opportunities": ["list", "of", "opportunities"]
+}}
+
+Focus on actionable insights for marketing strategy.
+"""
 
 class ClientIntelligenceSystem:
     """Manages client profiles, knowledge bases, and context-aware recommendations"""
 
     def __init__(self, db_path: str = "client_intelligence.db"):
-        self.db_path = db_path
-        self.ai_client = get_ai_client()
-        self.research_engine = AutonomousResearchEngine()
+        # Resolved once; ":memory:" is a SQLite keyword, not a file
+        self.db_path = db_path if db_path == ":memory:" else os.fspath(Path(db_path).expanduser().resolve())
+        self._lock = threading.Lock()
+        # Memoized client listings, tagged with the _profiles_stamp they were built at
+        self._profiles_version = 0
+        self._listings: Dict[str, Tuple[Tuple[int, int], List[Dict]]] = {}
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-20000")
         self._initialize_database()
 
+    @functools.cached_property
+    def ai_client(self):
+        """AI provider client, created on first use"""
+        from api_clients import get_ai_client
+        return get_ai_client()
+
+    @functools.cached_property
+    def research_engine(self):
+        """Market research engine, created on first use"""
+        from python_scripts.marketing_agents.research_strategist import AutonomousResearchEngine
+        return AutonomousResearchEngine()
+
+    def close(self):
+        """Close the client database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _profiles_stamp(self) -> Tuple[int, int]:
+        """Change marker for client_profiles: our own writes plus commits from other connections"""
+        return self._profiles_version, self._conn.execute("PRAGMA data_version").fetchone()[0]
+
     def _initialize_database(self):
         """Initialize SQLite database with client intelligence schema"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         # Client profiles table
         cursor.execute('''
@@ -46,6 +228,7 @@ class ClientIntelligenceSystem:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 client_name TEXT NOT NULL,
                 website_url TEXT UNIQUE,
+                domain TEXT,
                 industry TEXT,
                 business_type TEXT,
                 target_audience TEXT,
@@ -54,7 +237,7 @@ class ClientIntelligenceSystem:
                 primary_goals TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_analysis_date DATE,
+                last_analysis_date DATE DEFAULT (DATE('now', 'localtime')),
                 seo_score INTEGER,
                 profile_completion REAL DEFAULT 0.0
             )
@@ -96,6 +279,8 @@ class ClientIntelligenceSystem:
                 client_id INTEGER,
                 recommendation_type TEXT NOT NULL,
                 recommendation TEXT NOT NULL,
+                title TEXT,
+                description TEXT,
                 priority INTEGER DEFAULT 5,
                 status TEXT DEFAULT 'pending',
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -103,8 +288,36 @@ class ClientIntelligenceSystem:
             )
         ''')
 
-        conn.commit()
-        conn.close()
+        # Databases created before these columns were denormalized
+        for table, columns in (("client_recommendations", ("title", "description")), ("client_profiles", ("domain",))):
+            existing_columns = {row["name"] for row in cursor.execute(f"PRAGMA table_info({table})")}
+            for column in columns:
+                if column not in existing_columns:
+                    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+
+        missing_domains = cursor.execute("SELECT id, website_url FROM client_profiles WHERE domain IS NULL").fetchall()
+        cursor.executemany(
+            "UPDATE client_profiles SET domain = ? WHERE id = ?",
+            [(_display_domain(row["website_url"] or ""), row["id"]) for row in missing_domains]
+        )
+
+        # Parsed AI business-intelligence responses keyed by prompt hash
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS ai_cache (
+                prompt_hash TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        # Indexes backing the per-client lookups and recency-ordered listings
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_knowledge_client ON client_knowledge(client_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_recs_client_pri ON client_recommendations(client_id, status, priority DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_profiles_updated ON client_profiles(updated_at DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_profiles_domain ON client_profiles(domain)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaign_client ON campaign_history(client_id)')
+
+        self._conn.commit()
 
     def create_client_from_website(self, website_url: str, client_name: str = None) -> Dict:
         """Smart client onboarding - create profile from website URL"""
@@ -126,18 +339,24 @@ class ClientIntelligenceSystem:
         print(f"🏢 Client: {client_name}")
         print("⏳ Discovering business intelligence...\n")
 
+        from seo_analysis_engine import analyze_website_seo
+
         try:
-            # Phase 1: Website Analysis & SEO Intelligence
-            print("📊 Phase 1: Website Intelligence Extraction...")
-            seo_results = analyze_website_seo(website_url, "comprehensive", client_name)
-
-            # Phase 2: Market Intelligence
-            print("🔍 Phase 2: Market & Industry Intelligence...")
-            market_results = self.research_engine.conduct_research(
-                research_type="industry",
-                target_subject=f"{client_name} {domain}",
-                client_name=client_name
-            )
+            # Phases 1 & 2 are independent network-bound lookups; run them together
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                print("📊 Phase 1: Website Intelligence Extraction...")
+                seo_future = executor.submit(analyze_website_seo, website_url, "comprehensive", client_name)
+
+                print("🔍 Phase 2: Market & Industry Intelligence...")
+                market_future = executor.submit(
+                    self.research_engine.conduct_research,
+                    research_type="industry",
+                    target_subject=f"{client_name} {domain}",
+                    client_name=client_name
+                )
+
+                seo_results = seo_future.result()
+                market_results = market_future.result()
 
             # Phase 3: AI-Powered Business Intelligence
             print("🤖 Phase 3: AI Business Profile Analysis...")
@@ -181,85 +400,94 @@ class ClientIntelligenceSystem:
                 "website_url": website_url
             }
 
+    def onboard_batch(self, entries: List[Tuple[str, Optional[str]]], concurrency: int = 8) -> List[Dict]:
+        """Onboard several (website_url, client_name) entries concurrently, returning results in input order"""
+        # Discovery is network-bound; database writes are already serialised on the shared connection
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(entries)))) as executor:
+            futures = [executor.submit(self.create_client_from_website, url, name) for url, name in entries]
+            return [future.result() for future in futures]
+
     def _extract_business_intelligence(self, seo_data: Dict, market_data: Dict, website_url: str) -> Dict:
         """Use AI to extract deep business intelligence"""
 
         try:
-            # Compile data for AI analysis
-            analysis_prompt = f"""
-            Analyze this business data and extract key intelligence:
-
-            WEBSITE: {website_url}
-
-            SEO DATA:
-            - SEO Score: {seo_data.get('seo_score', 'N/A')}
-            - Technical Data: {json.dumps(seo_data.get('technical_data', {}), indent=2)[:1000]}
-
-            MARKET RESEARCH:
-            {json.dumps(market_data, indent=2)[:2000]}
-
-            Extract and return the following business intelligence as JSON:
-            {{
-                "industry": "specific industry category",
-                "business_type": "e.g., B2B, B2C, SaaS, Local Service, E-commerce",
-                "company_size": "Startup, Small, Medium, or Enterprise",
-                "target_audience": "detailed description of primary audience",
-                "value_proposition": "main value they provide",
-                "primary_goals": "likely marketing/business goals",
-                "competitive_advantage": "what sets them apart",
-                "growth_stage": "Early, Growth, Mature, or Declining",
-                "marketing_maturity": "Beginner, Intermediate, Advanced",
-                "recommended_brand_tone": "professional, casual, friendly, or authoritative",
-                "key_challenges": ["list", "of", "challenges"],
-                "opportunities": ["list", "of", "opportunities"]
-            }}
-
-            Focus on actionable insights for marketing strategy.
-            """
+            # Compile data for AI analysis; volatile fields are left out so the
+            # prompt (and its ai_cache hash) is stable across runs
+            analysis_prompt = _BI_PROMPT_TMPL.format(
+                website_url=website_url,
+                seo_score=seo_data.get('seo_score', 'N/A'),
+                technical_json=_json_excerpt(_without_volatile(seo_data.get('technical_data', {})), 1000),
+                market_json=_json_excerpt(_without_volatile(market_data), 2000)
+            )
+
+            prompt_hash = hashlib.sha256(analysis_prompt.encode()).hexdigest()
+            cached = self._get_cached_intelligence(prompt_hash)
+            if cached is not None:
+                return cached
 
             ai_response = self.ai_client.generate_content(analysis_prompt)
 
             if ai_response.success:
-                # Try to parse JSON from AI response
-                ai_content = ai_response.data.get("content", "")
-                try:
-                    # Extract JSON from the response
-                    json_start = ai_content.find('{')
-                    json_end = ai_content.rfind('}') + 1
-                    if json_start >= 0 and json_end > json_start:
-                        intelligence_json = ai_content[json_start:json_end]
-                        return json.loads(intelligence_json)
-                except:
-                    pass
-
-                # Fallback to basic analysis
-                return {
-                    "analysis_text": ai_content,
-                    "industry": "General Business",
-                    "business_type": "Unknown",
-                    "target_audience": "General audience",
-                    "recommended_brand_tone": "professional"
-                }
+                intelligence, parsed = self._parse_business_intelligence(ai_response.data.get("content", ""))
+                # A fallback profile would pin the placeholder for AI_CACHE_TTL_DAYS; retry next time instead
+                if parsed:
+                    self._cache_intelligence(prompt_hash, intelligence)
+                return intelligence
 
             return {"error": "AI analysis failed"}
 
         except Exception as e:
             return {"error": str(e)}
 
+    def _parse_business_intelligence(self, ai_content: str) -> Tuple[Dict, bool]:
+        """Parse the JSON intelligence block from an AI response; the flag is False for the fallback profile"""
+        try:
+            # Extract JSON from the response
+            intelligence_json = _first_json_object(ai_content)
+            if intelligence_json is not None:
+                return _json_loads(intelligence_json), True
+        except ValueError:  # json and orjson decode errors both subclass ValueError
+            pass
+
+        # Fallback to basic analysis
+        return {
+            "analysis_text": ai_content,
+            "industry": "General Business",
+            "business_type": "Unknown",
+            "target_audience": "General audience",
+            "recommended_brand_tone": "professional"
+        }, False
+
+    def _get_cached_intelligence(self, prompt_hash: str) -> Optional[Dict]:
+        """Return a cached intelligence response younger than AI_CACHE_TTL_DAYS"""
+        with self._lock:
+            row = self._conn.execute('''
+                SELECT response FROM ai_cache
+                WHERE prompt_hash = ? AND created_at > datetime('now', ?)
+            ''', (prompt_hash, f"-{AI_CACHE_TTL_DAYS} days")).fetchone()
+
+        return _json_loads(row["response"]) if row else None
+
+    def _cache_intelligence(self, prompt_hash: str, intelligence: Dict):
+        """Store a parsed intelligence response for reuse"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO ai_cache (prompt_hash, response, created_at) VALUES (?, ?, CURRENT_TIMESTAMP)',
+                (prompt_hash, _json_dumps(intelligence))
+            )
+
     def _build_client_profile(self, client_name: str, website_url: str,
                             seo_data: Dict, market_data: Dict, ai_intelligence: Dict) -> Dict:
         """Build comprehensive client profile"""
 
         # Calculate profile completion score
-        profile_fields = ['industry', 'business_type', 'target_audience', 'primary_goals']
-        completed_fields = sum(1 for field in profile_fields if ai_intelligence.get(field))
-        profile_completion = (completed_fields / len(profile_fields)) * 0.6  # 60% for basic fields
-
-        # Add bonus for additional data
-        if seo_data.get('seo_score'):
-            profile_completion += 0.2
-        if market_data.get('success'):
-            profile_completion += 0.2
+        completed_fields = (bool(ai_intelligence.get('industry')) + bool(ai_intelligence.get('business_type'))
+                            + bool(ai_intelligence.get('target_audience')) + bool(ai_intelligence.get('primary_goals')))
+        profile_completion = (
+            completed_fields * 0.15  # 60% across the four basic fields
+            + (0.2 if seo_data.get('seo_score') else 0.0)  # Bonus for additional data
+            + (0.2 if market_data.get('success') else 0.0)
+        )
 
         # Only include fields that exist in the database schema
         profile = {
@@ -271,43 +499,54 @@ class ClientIntelligenceSystem:
             "brand_tone": str(ai_intelligence.get("recommended_brand_tone", "professional")),
             "company_size": str(ai_intelligence.get("company_size", "Unknown")),
             "primary_goals": str(ai_intelligence.get("primary_goals", "Increase online presence")),
-            "seo_score": seo_data.get("seo_score") if seo_data.get("seo_score") is not None else 0,
-            "profile_completion": min(profile_completion, 1.0),
-            "last_analysis_date": datetime.now().date().isoformat()
+            "seo_score": int(seo_data.get("seo_score") or 0),
+            "profile_completion": min(profile_completion, 1.0)
         }
 
         return profile
 
     def _save_client_profile(self, profile: Dict) -> int:
         """Save client profile to database and return client_id"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         try:
-            # Validate and sanitize all values for SQLite compatibility
+            # Values are already SQLite-ready; _build_client_profile coerces them
             sanitized_values = (
-                str(profile.get("client_name", "Unknown Client")),
-                str(profile.get("website_url", "")),
-                str(profile.get("industry", "General Business")),
-                str(profile.get("business_type", "Unknown")),
-                str(profile.get("target_audience", "General audience")),
-                str(profile.get("brand_tone", "professional")),
-                str(profile.get("company_size", "Unknown")),
-                str(profile.get("primary_goals", "Increase online presence")),
-                int(profile.get("seo_score", 0)) if profile.get("seo_score") is not None else 0,
-                float(profile.get("profile_completion", 0.0)),
-                str(profile.get("last_analysis_date", datetime.now().date().isoformat()))
+                profile["client_name"],
+                profile["website_url"],
+                _display_domain(profile["website_url"]),
+                profile.get("industry", "General Business"),
+                profile.get("business_type", "Unknown"),
+                profile.get("target_audience", "General audience"),
+                profile.get("brand_tone", "professional"),
+                profile.get("company_size", "Unknown"),
+                profile.get("primary_goals", "Increase online presence"),
+                profile.get("seo_score", 0),
+                profile.get("profile_completion", 0.0),
+                profile.get("last_analysis_date")
             )
 
-            cursor.execute('''
-                INSERT OR REPLACE INTO client_profiles
-                (client_name, website_url, industry, business_type, target_audience,
-                 brand_tone, company_size, primary_goals, seo_score, profile_completion, last_analysis_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', sanitized_values)
-
-            client_id = cursor.lastrowid
-            conn.commit()
+            with self._lock, self._conn:
+                # Upsert in place so the id, created_at and dependent rows survive a re-discovery
+                row = self._conn.execute('''
+                    INSERT INTO client_profiles
+                    (client_name, website_url, domain, industry, business_type, target_audience,
+                     brand_tone, company_size, primary_goals, seo_score, profile_completion, last_analysis_date)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, DATE('now', 'localtime')))
+                    ON CONFLICT(website_url) DO UPDATE SET
+                        client_name = excluded.client_name,
+                        industry = excluded.industry,
+                        business_type = excluded.business_type,
+                        target_audience = excluded.target_audience,
+                        brand_tone = excluded.brand_tone,
+                        company_size = excluded.company_size,
+                        primary_goals = excluded.primary_goals,
+                        seo_score = excluded.seo_score,
+                        profile_completion = excluded.profile_completion,
+                        last_analysis_date = excluded.last_analysis_date,
+                        updated_at = CURRENT_TIMESTAMP
+                    RETURNING id
+                ''', sanitized_values).fetchone()
+                client_id = row["id"]
+                self._profiles_version += 1
 
             print(f"✅ Client profile saved successfully (ID: {client_id})")
             return client_id
@@ -315,31 +554,24 @@ class ClientIntelligenceSystem:
         except Exception as e:
             print(f"❌ Error saving client profile: {str(e)}")
             print(f"Profile data: {profile}")
-            conn.rollback()
             raise
-        finally:
-            conn.close()
 
     def _store_knowledge_base(self, client_id: int, seo_data: Dict, market_data: Dict, ai_intelligence: Dict):
         """Store extracted knowledge in the knowledge base"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         knowledge_items = [
-            ("seo_analysis", json.dumps(seo_data), 0.9, "SEO Analysis Engine"),
-            ("market_research", json.dumps(market_data), 0.8, "Research Intelligence"),
-            ("ai_intelligence", json.dumps(ai_intelligence), 0.85, "AI Analysis")
+            (client_id, "seo_analysis", _json_dumps(seo_data), 0.9, "SEO Analysis Engine"),
+            (client_id, "market_research", _json_dumps(market_data), 0.8, "Research Intelligence"),
+            (client_id, "ai_intelligence", _json_dumps(ai_intelligence), 0.85, "AI Analysis")
         ]
 
-        for knowledge_type, data, confidence, source in knowledge_items:
-            cursor.execute('''
+        with self._lock, self._conn:
+            # A re-discovery supersedes the client's previous knowledge
+            self._conn.execute('DELETE FROM client_knowledge WHERE client_id = ?', (client_id,))
+            self._conn.executemany('''
                 INSERT INTO client_knowledge
                 (client_id, knowledge_type, knowledge_data, confidence_score, source)
                 VALUES (?, ?, ?, ?, ?)
-            ''', (client_id, knowledge_type, data, confidence, source))
-
-        conn.commit()
-        conn.close()
+            ''', knowledge_items)
 
     def _generate_client_recommendations(self, client_id: int, profile: Dict) -> List[Dict]:
         """Generate smart recommendations based on client profile"""
@@ -355,240 +587,206 @@ class ClientIntelligenceSystem:
                 "estimated_impact": "High"
             })
 
-        # Content recommendations based on business type
+        # Static rules, in one pass over the table
         business_type = profile.get("business_type", "").lower()
-        if "saas" in business_type or "software" in business_type:
-            recommendations.append({
-                "type": "content_strategy",
-                "title": "SaaS Content Marketing Strategy",
-                "description": "Create educational content, case studies, and free tools to attract prospects.",
-                "priority": 2,
-                "estimated_impact": "Medium"
-            })
-        elif "local" in business_type or "service" in business_type:
-            recommendations.append({
-                "type": "local_seo",
-                "title": "Local SEO Optimization",
-                "description": "Focus on Google My Business, local keywords, and location-based content.",
-                "priority": 1,
-                "estimated_impact": "High"
-            })
-
-        # Marketing maturity recommendations
-        if profile.get("marketing_maturity") == "Beginner":
-            recommendations.append({
-                "type": "foundation",
-                "title": "Marketing Foundation Setup",
-                "description": "Establish basic marketing infrastructure: analytics, email marketing, social presence.",
-                "priority": 1,
-                "estimated_impact": "High"
-            })
-
-        # Growth stage recommendations
-        if profile.get("growth_stage") == "Early":
-            recommendations.append({
-                "type": "growth_strategy",
-                "title": "Growth Stage Marketing",
-                "description": "Focus on customer acquisition and retention strategies.",
-                "priority": 2,
-                "estimated_impact": "Medium"
-            })
+        recommendations.extend(dict(rec) for matches, rec in _RECOMMENDATION_RULES if matches(business_type, profile))
 
         return recommendations
 
     def _save_recommendations(self, client_id: int, recommendations: List[Dict]):
         """Save recommendations to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        rows = [
+            (client_id, rec["type"], _json_dumps(rec), rec.get("title"), rec.get("description"), rec.get("priority", 5))
+            for rec in recommendations
+        ]
 
-        for rec in recommendations:
-            cursor.execute('''
+        with self._lock, self._conn:
+            # Replace outstanding recommendations; acted-on ones are kept for history
+            self._conn.execute(
+                "DELETE FROM client_recommendations WHERE client_id = ? AND status = 'pending'", (client_id,)
+            )
+            self._conn.executemany('''
                 INSERT INTO client_recommendations
-                (client_id, recommendation_type, recommendation, priority)
-                VALUES (?, ?, ?, ?)
-            ''', (
-                client_id,
-                rec["type"],
-                json.dumps(rec),
-                rec.get("priority", 5)
-            ))
-
-        conn.commit()
-        conn.close()
+                (client_id, recommendation_type, recommendation, title, description, priority)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
 
     def get_client_profiles(self) -> List[Dict]:
         """Get all client profiles"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT id, client_name, website_url, industry, business_type,
-                   target_audience, profile_completion, last_analysis_date, seo_score
-            FROM client_profiles
-            ORDER BY updated_at DESC
-        ''')
+        with self._lock:
+            stamp = self._profiles_stamp()
+            cached = self._listings.get("profiles")
+            if cached and cached[0] == stamp:
+                return cached[1]
+
+            rows = self._conn.execute('''
+                SELECT id, client_name, website_url, industry, business_type,
+                       target_audience, profile_completion, last_analysis_date, seo_score
+                FROM client_profiles
+                ORDER BY updated_at DESC
+            ''').fetchall()
 
         profiles = []
-        for row in cursor.fetchall():
+        for row in rows:
             profiles.append({
-                "id": row[0],
-                "client_name": row[1],
-                "website_url": row[2],
-                "industry": row[3],
-                "business_type": row[4],
-                "target_audience": row[5],
-                "profile_completion": row[6],
-                "last_analysis_date": row[7],
-                "seo_score": row[8]
+                "id": row["id"],
+                "client_name": row["client_name"],
+                "website_url": row["website_url"],
+                "industry": row["industry"],
+                "business_type": row["business_type"],
+                "target_audience": row["target_audience"],
+                "profile_completion": row["profile_completion"],
+                "last_analysis_date": row["last_analysis_date"],
+                "seo_score": row["seo_score"]
             })
 
-        conn.close()
+        with self._lock:
+            self._listings["profiles"] = (stamp, profiles)
         return profiles
 
     def list_clients(self) -> List[Dict]:
         """Get simplified client list for UI display"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         try:
-            cursor.execute('''
-                SELECT id, client_name, website_url
-                FROM client_profiles
-                ORDER BY updated_at DESC
-            ''')
-
-            clients = []
-            for row in cursor.fetchall():
-                # Extract domain from website_url for cleaner display
-                website_url = row[2] or ""
-                domain = website_url.replace("https://", "").replace("http://", "").split("/")[0]
-
-                clients.append({
-                    "id": row[0],
-                    "name": row[1],
-                    "domain": domain
-                })
-
+            with self._lock:
+                stamp = self._profiles_stamp()
+                cached = self._listings.get("clients")
+                if cached and cached[0] == stamp:
+                    return cached[1]
+
+                rows = self._conn.execute('''
+                    SELECT id, client_name, domain
+                    FROM client_profiles
+                    ORDER BY updated_at DESC
+                ''').fetchall()
+
+            clients = [{"id": row["id"], "name": row["client_name"], "domain": row["domain"]} for row in rows]
+
+            with self._lock:
+                self._listings["clients"] = (stamp, clients)
             return clients
 
         except Exception as e:
             print(f"❌ Error listing clients: {str(e)}")
             return []
-        finally:
-            conn.close()
 
     def get_client_profile(self, client_id: int) -> Dict:
         """Get single client profile by ID"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         try:
-            cursor.execute('''
-                SELECT client_name, website_url, industry, business_type, target_audience,
-                       brand_tone, company_size, primary_goals, seo_score, profile_completion,
-                       last_analysis_date
-                FROM client_profiles
-                WHERE id = ?
-            ''', (client_id,))
+            with self._lock:
+                row = self._conn.execute('''
+                    SELECT client_name, website_url, domain, industry, business_type, target_audience,
+                           brand_tone, company_size, primary_goals, seo_score, profile_completion,
+                           last_analysis_date
+                    FROM client_profiles
+                    WHERE id = ?
+                ''', (client_id,)).fetchone()
 
-            row = cursor.fetchone()
             if not row:
                 return None
 
-            # Extract domain for cleaner display
-            website_url = row[1] or ""
-            domain = website_url.replace("https://", "").replace("http://", "").split("/")[0]
-
             return {
                 "id": client_id,
-                "name": row[0],
-                "domain": domain,
-                "website_url": row[1],
-                "industry": row[2],
-                "business_type": row[3],
-                "target_audience": row[4],
-                "brand_tone": row[5],
-                "company_size": row[6],
-                "primary_goals": row[7],
-                "seo_score": row[8],
-                "profile_completion": row[9],
-                "last_analysis_date": row[10],
+                "name": row["client_name"],
+                "domain": row["domain"],
+                "website_url": row["website_url"],
+                "industry": row["industry"],
+                "business_type": row["business_type"],
+                "target_audience": row["target_audience"],
+                "brand_tone": row["brand_tone"],
+                "company_size": row["company_size"],
+                "primary_goals": row["primary_goals"],
+                "seo_score": row["seo_score"],
+                "profile_completion": row["profile_completion"],
+                "last_analysis_date": row["last_analysis_date"],
                 "location": ""  # Add empty location for compatibility
             }
 
         except Exception as e:
             print(f"❌ Error getting client profile: {str(e)}")
             return None
-        finally:
-            conn.close()
-
-    def get_client_recommendations(self, client_id: int) -> List[str]:
-        """Get client recommendations as simple strings for UI display"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
 
+    def get_client_recommendations(self, client_id: int, limit: Optional[int] = None) -> List[str]:
+        """Get the top client recommendations as simple strings for UI display"""
         try:
-            cursor.execute('''
-                SELECT recommendation
-                FROM client_recommendations
-                WHERE client_id = ?
-                ORDER BY priority DESC
-            ''', (client_id,))
+            # The JSON blob is only fetched for legacy rows without denormalized columns
+            with self._lock:
+                rows = self._conn.execute('''
+                    SELECT title, description,
+                           CASE WHEN title IS NULL THEN recommendation END AS recommendation
+                    FROM client_recommendations
+                    WHERE client_id = ?
+                    ORDER BY priority
+                    LIMIT ?
+                ''', (client_id, -1 if limit is None else limit)).fetchall()
 
             recommendations = []
-            for row in cursor.fetchall():
+            for row in rows:
+                if row["title"] is not None:
+                    recommendations.append(f"{row['title']}: {row['description']}")
+                    continue
+                recommendation = row["recommendation"]
+                # We always store a JSON object, so anything else is raw text not worth parsing
+                if recommendation[:1] != '{':
+                    recommendations.append(str(recommendation))
+                    continue
                 try:
                     # The recommendation is stored as JSON, extract the text
-                    rec_data = json.loads(row[0])
+                    rec_data = _json_loads(recommendation)
                     rec_text = rec_data.get("text", str(rec_data))
                     recommendations.append(rec_text)
-                except:
+                except ValueError:
                     # Fallback to raw text
-                    recommendations.append(str(row[0]))
+                    recommendations.append(str(recommendation))
 
             return recommendations
 
         except Exception as e:
             print(f"❌ Error getting client recommendations: {str(e)}")
             return []
-        finally:
-            conn.close()
 
     def get_client_context(self, client_id: int) -> Dict:
         """Get full client context for tool integration"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Get client profile
-        cursor.execute('SELECT * FROM client_profiles WHERE id = ?', (client_id,))
-        profile_row = cursor.fetchone()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        if not profile_row:
-            return {"error": "Client not found"}
+            # Get client profile
+            cursor.execute('''
+                SELECT client_name, website_url, industry, business_type, target_audience,
+                       brand_tone, company_size, primary_goals, seo_score, profile_completion
+                FROM client_profiles
+                WHERE id = ?
+            ''', (client_id,))
+            profile_row = cursor.fetchone()
 
-        # Get knowledge base
-        cursor.execute('SELECT knowledge_type, knowledge_data FROM client_knowledge WHERE client_id = ?', (client_id,))
-        knowledge_items = cursor.fetchall()
+            if not profile_row:
+                return {"error": "Client not found"}
 
-        # Get recommendations
-        cursor.execute('SELECT recommendation FROM client_recommendations WHERE client_id = ? AND status = "pending"', (client_id,))
-        recommendations = [json.loads(row[0]) for row in cursor.fetchall()]
+            # Get knowledge base and pending recommendations in one pass
+            cursor.execute('''
+                SELECT knowledge_type AS kind, knowledge_data AS data
+                FROM client_knowledge WHERE client_id = ?
+                UNION ALL
+                SELECT NULL, recommendation
+                FROM client_recommendations WHERE client_id = ? AND status = 'pending'
+            ''', (client_id, client_id))
+            detail_rows = cursor.fetchall()
 
-        conn.close()
+        knowledge_items = [(row["kind"], row["data"]) for row in detail_rows if row["kind"] is not None]
+        recommendations = [_json_loads(row["data"]) for row in detail_rows if row["kind"] is None]
 
         # Build complete context
         context = {
             "client_id": client_id,
-            "client_name": profile_row[1],
-            "website_url": profile_row[2],
-            "industry": profile_row[3],
-            "business_type": profile_row[4],
-            "target_audience": profile_row[5],
-            "brand_tone": profile_row[6],
-            "company_size": profile_row[7],
-            "primary_goals": profile_row[8],
-            "seo_score": profile_row[12],
-            "profile_completion": profile_row[13],
+            "client_name": profile_row["client_name"],
+            "website_url": profile_row["website_url"],
+            "industry": profile_row["industry"],
+            "business_type": profile_row["business_type"],
+            "target_audience": profile_row["target_audience"],
+            "brand_tone": profile_row["brand_tone"],
+            "company_size": profile_row["company_size"],
+            "primary_goals": profile_row["primary_goals"],
+            "seo_score": profile_row["seo_score"],
+            "profile_completion": profile_row["profile_completion"],
             "knowledge_base": {},
             "recommendations": recommendations
         }
@@ -596,8 +794,8 @@ class ClientIntelligenceSystem:
         # Add knowledge base data
         for knowledge_type, knowledge_data in knowledge_items:
             try:
-                context["knowledge_base"][knowledge_type] = json.loads(knowledge_data)
-            except:
+                context["knowledge_base"][knowledge_type] = _json_loads(knowledge_data)
+            except (ValueError, TypeError):
                 context["knowledge_base"][knowledge_type] = knowledge_data
 
         return context
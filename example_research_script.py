@@ -5,42 +5,87 @@ This script demonstrates how to accept parameters and output results
 """
 
 import sys
-import argparse
 import json
 from datetime import datetime
 import time
 import random
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+USAGE = "usage: example_research_script.py [-h] [--depth {quick,standard,deep}] [--format {text,json,markdown}] [--json JSON] [topic]"
+
+# Allowed values for each option flag
+CHOICES = {
+    '--depth': frozenset({'quick', 'standard', 'deep'}),
+    '--format': frozenset({'text', 'json', 'markdown'}),
+    '--json': None
+}
+
+def _usage_error(message):
+    """Report a command-line error the way argparse would and exit"""
+    print(USAGE, file=sys.stderr)
+    print(f"example_research_script.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+def parse_args(argv):
+    """Parse [topic] [--depth D] [--format F] [--json JSON] without argparse's startup cost"""
+    options = {'--depth': 'standard', '--format': 'text', '--json': None}
+    topic = None
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-h', '--help'):
+            print(USAGE)
+            sys.exit(0)
+        if arg.startswith('--'):
+            flag, eq, value = arg.partition('=')
+            if flag not in CHOICES:
+                _usage_error(f"unrecognized arguments: {arg}")
+            if not eq:
+                i += 1
+                if i >= len(argv):
+                    _usage_error(f"argument {flag}: expected one argument")
+                value = argv[i]
+            allowed = CHOICES[flag]
+            if allowed is not None and value not in allowed:
+                _usage_error(f"argument {flag}: invalid choice: '{value}'")
+            options[flag] = value
+        elif topic is None:
+            topic = arg
+        else:
+            _usage_error(f"unrecognized arguments: {arg}")
+        i += 1
+
+    return 'AI' if topic is None else topic, options['--depth'], options['--format'], options['--json']
+
 def main():
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='Research Script Example')
-    parser.add_argument('topic', nargs='?', default='AI', help='Topic to research')
-    parser.add_argument('--depth', default='standard', choices=['quick', 'standard', 'deep'])
-    parser.add_argument('--format', default='text', choices=['text', 'json', 'markdown'])
-    parser.add_argument('--json', help='Accept all parameters as JSON')
-    
-    args = parser.parse_args()
+    topic, depth, output_format, json_params = parse_args(sys.argv[1:])
     
     # Handle JSON input if provided
-    if args.json:
-        params = json.loads(args.json)
+    if json_params:
+        params = orjson.loads(json_params) if ORJSON_AVAILABLE else json.loads(json_params)
         topic = params.get('topic', 'AI')
         depth = params.get('depth', 'standard')
         output_format = params.get('format', 'text')
-    else:
-        topic = args.topic
-        depth = args.depth
-        output_format = args.format
     
+    # Collect the report and write it in one go at the end
+    lines = []
+    out = lines.append
+
     # Simulate research process
-    print("=" * 60)
-    print(f"RESEARCH REPORT: {topic.upper()}")
-    print("=" * 60)
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Depth: {depth}")
-    print(f"Format: {output_format}")
-    print("=" * 60)
-    print()
+    out("=" * 60)
+    out(f"RESEARCH REPORT: {topic.upper()}")
+    out("=" * 60)
+    out(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    out(f"Depth: {depth}")
+    out(f"Format: {output_format}")
+    out("=" * 60)
+    out("")
     
     # Simulate different research phases
     phases = {
@@ -50,32 +95,32 @@ def main():
     }
     
     for i, phase in enumerate(phases[depth], 1):
-        print(f"Phase {i}: {phase}")
-        print("-" * 40)
+        out(f"Phase {i}: {phase}")
+        out("-" * 40)
         
         # Simulate work
         time.sleep(0.5)
         
         # Generate sample output for each phase
         if phase == 'Web Search':
-            print(f"✓ Found {random.randint(100, 1000)} sources about {topic}")
-            print(f"✓ Identified {random.randint(5, 20)} key themes")
+            out(f"✓ Found {random.randint(100, 1000)} sources about {topic}")
+            out(f"✓ Identified {random.randint(5, 20)} key themes")
         elif phase == 'Data Collection':
-            print(f"✓ Collected {random.randint(50, 500)} data points")
-            print(f"✓ Processed {random.randint(10, 50)} documents")
+            out(f"✓ Collected {random.randint(50, 500)} data points")
+            out(f"✓ Processed {random.randint(10, 50)} documents")
         elif 'Analysis' in phase:
-            print(f"✓ Analyzed trends and patterns")
-            print(f"✓ Confidence score: {random.randint(75, 95)}%")
+            out(f"✓ Analyzed trends and patterns")
+            out(f"✓ Confidence score: {random.randint(75, 95)}%")
         elif phase == 'Insights':
-            print(f"✓ Generated {random.randint(3, 8)} key insights")
-            print(f"✓ Identified {random.randint(2, 5)} opportunities")
+            out(f"✓ Generated {random.randint(3, 8)} key insights")
+            out(f"✓ Identified {random.randint(2, 5)} opportunities")
         
-        print()
+        out("")
     
     # Generate final output based on format
-    print("=" * 60)
-    print("RESULTS")
-    print("=" * 60)
+    out("=" * 60)
+    out("RESULTS")
+    out("=" * 60)
     
     if output_format == 'json':
         results = {
@@ -98,10 +143,13 @@ def main():
                 "Recommendation 3"
             ]
         }
-        print(json.dumps(results, indent=2))
+        if ORJSON_AVAILABLE:
+            out(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
+        else:
+            out(json.dumps(results, indent=2))
         
     elif output_format == 'markdown':
-        print(f"""
+        out(f"""
 # Research Report: {topic}
 
 ## Executive Summary
@@ -126,7 +174,7 @@ Comprehensive analysis of {topic} reveals significant opportunities and trends.
 {topic} presents significant opportunities for growth and innovation.
 """)
     else:  # text format
-        print(f"""
+        out(f"""
 KEY FINDINGS ABOUT {topic.upper()}:
 
 1. Market Growth: The {topic} sector shows {random.randint(15, 45)}% YoY growth
@@ -153,9 +201,10 @@ RECOMMENDATIONS:
 CONFIDENCE SCORE: {random.randint(75, 95)}%
 """)
     
-    print("=" * 60)
-    print("RESEARCH COMPLETE")
-    print("=" * 60)
+    out("=" * 60)
+    out("RESEARCH COMPLETE")
+    out("=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,31 +5,101 @@ Provides user-friendly interface enhancements for marketing tools
 
 import json
 import os
+import re
 import streamlit as st
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Score line in the text report, e.g. "SEO SCORE: 72/100"
+_SEO_SCORE_RE = re.compile(r'SEO SCORE:.*?(\d+)/100')
+
+# Tool groupings shown by show_marketing_categories: (heading, script files)
+MARKETING_CATEGORIES = (
+    ("🚀 Getting Started", ("seo_strategist.py", "copywriter.py")),
+    ("🔍 Research & Analysis", ("research_strategist.py", "analyzer.py")),
+    ("🎯 Conversion & Growth", ("conversion_strategist.py", "idea_strategist.py")),
+    ("📱 Social & Content", ("social_strategist.py",)),
+    ("📊 Reporting & Management", ("generate_marketing_report.py", "client_onboarding.py", "notion_sync.py"))
+)
+
+# Example outcomes shown by display_success_stories
+SUCCESS_STORIES = (
+    {
+        "title": "Local Restaurant Doubled Website Traffic",
+        "tool": "SEO Strategist",
+        "result": "Found 15 local SEO improvements, implemented top 5, saw 120% traffic increase in 3 months",
+        "tip": "Focus on Google My Business optimization for local businesses"
+    },
+    {
+        "title": "E-commerce Store Improved Conversion Rate by 40%",
+        "tool": "Conversion Optimizer",
+        "result": "Optimized checkout process, reduced cart abandonment from 70% to 42%",
+        "tip": "Test one change at a time to see what really works"
+    },
+    {
+        "title": "SaaS Company Generated 300 New Leads",
+        "tool": "Content Creator + Campaign Creator",
+        "result": "Created lead magnet content and promotional campaign, 3x lead generation",
+        "tip": "Combine multiple tools for compound results"
+    }
+)
+
+# Turns a script file stem into words for the fallback display name
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
+CATALOG_PATH = Path(__file__).parent / "marketing_catalog.json"
+
+@st.cache_data(show_spinner=False)
+def _read_marketing_catalog(catalog_mtime: float):
+    """Parse the catalog file; cached per modification time so edits are picked up"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(CATALOG_PATH.read_bytes())
+    with open(CATALOG_PATH, 'r') as f:
+        return json.load(f)
+
+@st.cache_data(show_spinner=False)
+def _index_marketing_catalog(catalog_mtime: float):
+    """Flat {script_name: info} view of the catalog, first category wins"""
+    index = {}
+    for scripts in _read_marketing_catalog(catalog_mtime).values():
+        for script_name, info in scripts.items():
+            index.setdefault(script_name, info)
+    return index
+
+def _catalog_mtime():
+    """Modification time of the catalog file, or None if it is missing"""
+    try:
+        return CATALOG_PATH.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
 def load_marketing_catalog():
     """Load the marketing tools catalog with descriptions"""
-    catalog_path = Path(__file__).parent / "marketing_catalog.json"
-    if catalog_path.exists():
-        with open(catalog_path, 'r') as f:
-            return json.load(f)
-    return {}
+    catalog_mtime = _catalog_mtime()
+    return {} if catalog_mtime is None else _read_marketing_catalog(catalog_mtime)
+
+def _script_catalog_index():
+    """Catalog entries keyed by script file name"""
+    catalog_mtime = _catalog_mtime()
+    return {} if catalog_mtime is None else _index_marketing_catalog(catalog_mtime)
 
 def get_script_info(script_path):
     """Get user-friendly information about a script"""
-    catalog = load_marketing_catalog()
     script_name = os.path.basename(script_path)
 
-    # Check all categories for the script
-    for category_name, scripts in catalog.items():
-        if script_name in scripts:
-            return scripts[script_name]
+    script_info = _script_catalog_index().get(script_name)
+    if script_info is not None:
+        return script_info
 
     # Default fallback for unknown scripts
     return {
-        "name": script_name.replace('.py', '').replace('_', ' ').title(),
+        "name": script_name.removesuffix('.py').translate(_UNDERSCORE_TO_SPACE).title(),
         "description": "Python script for automation",
         "status": "❓ Unknown",
         "category": "Other"
@@ -41,21 +111,25 @@ def display_marketing_tool_card(script_path, script_info):
     # Create an expandable card
     with st.expander(f"{script_info.get('name', 'Unknown Tool')} - {script_info.get('status', '❓')}"):
 
-        # Basic info
-        st.markdown(f"**Category:** {script_info.get('category', 'Other')}")
-        st.markdown(f"**What it does:** {script_info.get('description', 'No description available')}")
+        # Basic info, sent as a single markdown element
+        parts = [
+            f"**Category:** {script_info.get('category', 'Other')}",
+            f"**What it does:** {script_info.get('description', 'No description available')}"
+        ]
 
         if 'what_it_does' in script_info:
-            st.markdown(f"**Details:** {script_info['what_it_does']}")
+            parts.append(f"**Details:** {script_info['what_it_does']}")
 
         if 'perfect_for' in script_info:
-            st.markdown(f"💡 **Perfect for:** {script_info['perfect_for']}")
+            parts.append(f"💡 **Perfect for:** {script_info['perfect_for']}")
 
         if 'example_use' in script_info:
-            st.markdown(f"📝 **Example:** {script_info['example_use']}")
+            parts.append(f"📝 **Example:** {script_info['example_use']}")
 
         if 'time_to_complete' in script_info:
-            st.markdown(f"⏱️ **Time:** {script_info['time_to_complete']}")
+            parts.append(f"⏱️ **Time:** {script_info['time_to_complete']}")
+
+        st.markdown("\n\n".join(parts))
 
         # Setup notes if any
         if script_info.get('setup_note'):
@@ -65,6 +139,10 @@ def display_marketing_tool_card(script_path, script_info):
         if 'next_steps' in script_info:
             st.markdown(f"**Next steps:** {script_info['next_steps']}")
 
+def _option_labels(options_list):
+    """Display labels for catalog dropdown options"""
+    return tuple(f"{opt['label']}" + (f" - {opt['description']}" if 'description' in opt else "") for opt in options_list)
+
 def create_guided_form(script_path, script_info, selected_client_profile=None):
     """Create user-friendly form for script parameters with optional client context"""
 
@@ -105,11 +183,11 @@ def create_guided_form(script_path, script_info, selected_client_profile=None):
             options_list = input_config['options']
             if isinstance(options_list[0], dict):
                 # Complex options with descriptions
-                option_labels = [f"{opt['label']}" + (f" - {opt['description']}" if 'description' in opt else "") for opt in options_list]
+                option_labels = _option_labels(options_list)
                 selected_index = st.selectbox(
                     label,
                     range(len(option_labels)),
-                    format_func=lambda x: option_labels[x],
+                    format_func=option_labels.__getitem__,
                     help=help_text
                 )
                 selected_value = options_list[selected_index]['value']
@@ -190,60 +268,27 @@ def display_success_stories():
     """Show example success stories and use cases"""
     st.markdown("## 🎉 Success Stories")
 
-    stories = [
-        {
-            "title": "Local Restaurant Doubled Website Traffic",
-            "tool": "SEO Strategist",
-            "result": "Found 15 local SEO improvements, implemented top 5, saw 120% traffic increase in 3 months",
-            "tip": "Focus on Google My Business optimization for local businesses"
-        },
-        {
-            "title": "E-commerce Store Improved Conversion Rate by 40%",
-            "tool": "Conversion Optimizer",
-            "result": "Optimized checkout process, reduced cart abandonment from 70% to 42%",
-            "tip": "Test one change at a time to see what really works"
-        },
-        {
-            "title": "SaaS Company Generated 300 New Leads",
-            "tool": "Content Creator + Campaign Creator",
-            "result": "Created lead magnet content and promotional campaign, 3x lead generation",
-            "tip": "Combine multiple tools for compound results"
-        }
-    ]
-
-    for story in stories:
+    for story in SUCCESS_STORIES:
         with st.expander(f"📈 {story['title']} (using {story['tool']})"):
-            st.markdown(f"**Result:** {story['result']}")
-            st.markdown(f"💡 **Tip:** {story['tip']}")
+            st.markdown(f"**Result:** {story['result']}\n\n💡 **Tip:** {story['tip']}")
 
 def display_seo_analysis_results(output_text: str):
     """Parse and display SEO analysis results in a rich format"""
 
-    # Check if this looks like JSON output
-    try:
-        if output_text.strip().startswith('{'):
-            results = json.loads(output_text)
+    # Only attempt a JSON parse when the output looks like a JSON object
+    stripped = output_text.lstrip()
+    if stripped[:1] == '{':
+        try:
+            results = orjson.loads(stripped) if ORJSON_AVAILABLE else json.loads(stripped)
+        except ValueError:
+            results = None
+        if isinstance(results, dict):
             _display_structured_seo_results(results)
             return
-    except:
-        pass
-
-    # Parse text output for key information
-    lines = output_text.split('\n')
-
-    # Look for key sections in the output
-    seo_score = None
-    for line in lines:
-        if 'SEO SCORE:' in line:
-            # Extract score
-            try:
-                import re
-                score_match = re.search(r'(\d+)/100', line)
-                if score_match:
-                    seo_score = int(score_match.group(1))
-            except:
-                pass
-            break
+
+    # Parse text output for the SEO score
+    score_match = _SEO_SCORE_RE.search(output_text)
+    seo_score = int(score_match.group(1)) if score_match else None
 
     # Display SEO score prominently if found
     if seo_score is not None:
@@ -370,20 +415,22 @@ def _display_structured_seo_results(results: dict):
                 volume = kw.get('vol', kw.get('search_volume', 'N/A'))
                 st.markdown(f"• **{kw_name}** (Volume: {volume})")
 
-    # Download options
+    # Download options, both stamped with the same export time
+    export_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     st.markdown("### 📥 Export Options")
     col1, col2 = st.columns(2)
 
     with col1:
         st.download_button(
             label="📊 Download JSON Report",
-            data=json.dumps(results, indent=2),
-            file_name=f"seo_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            data=orjson.dumps(results, option=orjson.OPT_INDENT_2) if ORJSON_AVAILABLE else json.dumps(results, indent=2),
+            file_name=f"seo_analysis_{export_stamp}.json",
             mime="application/json"
         )
 
     with col2:
         # Create text summary
+        key_recommendations = "\n".join(f"• {rec.get('recommendation', 'N/A')}" for rec in recommendations[:5])
         summary = f"""
 SEO Analysis Report
 ==================
@@ -392,43 +439,29 @@ SEO Score: {results.get('seo_score', 'N/A')}/100
 Analysis Date: {results.get('timestamp', 'N/A')}
 
 Key Recommendations:
-{chr(10).join([f"• {rec.get('recommendation', 'N/A')}" for rec in recommendations[:5]])}
+{key_recommendations}
 """
         st.download_button(
             label="📝 Download Text Summary",
             data=summary,
-            file_name=f"seo_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            file_name=f"seo_summary_{export_stamp}.txt",
             mime="text/plain"
         )
 
 def show_marketing_categories():
     """Display marketing tools organized by category"""
-    catalog = load_marketing_catalog()
-
-    categories = {
-        "🚀 Getting Started": ["seo_strategist.py", "copywriter.py"],
-        "🔍 Research & Analysis": ["research_strategist.py", "analyzer.py"],
-        "🎯 Conversion & Growth": ["conversion_strategist.py", "idea_strategist.py"],
-        "📱 Social & Content": ["social_strategist.py"],
-        "📊 Reporting & Management": ["generate_marketing_report.py", "client_onboarding.py", "notion_sync.py"]
-    }
+    catalog_index = _script_catalog_index()
 
-    for category_name, script_files in categories.items():
+    for category_name, script_files in MARKETING_CATEGORIES:
         st.markdown(f"### {category_name}")
 
         for script_file in script_files:
-            # Find the script info
-            script_info = None
-            for cat_scripts in catalog.values():
-                if script_file in cat_scripts:
-                    script_info = cat_scripts[script_file]
-                    break
+            script_info = catalog_index.get(script_file)
 
             if script_info:
                 col1, col2 = st.columns([3, 1])
                 with col1:
-                    st.markdown(f"**{script_info['name']}**")
-                    st.markdown(f"*{script_info['description']}*")
+                    st.markdown(f"**{script_info['name']}**\n\n*{script_info['description']}*")
                 with col2:
                     st.markdown(script_info.get('status', '❓'))
 
@@ -243,11 +243,11 @@ if CLIENT_INTELLIGENCE_AVAILABLE:
                     with profile_tab2:
                         # Get fresh recommendations
                         recommendations = st.session_state.client_intelligence.get_client_recommendations(
-                            st.session_state.selected_client_id
+                            st.session_state.selected_client_id, limit=8
                         )
 
                         if recommendations:
-                            for i, rec in enumerate(recommendations[:8], 1):
+                            for i, rec in enumerate(recommendations, 1):
                                 st.markdown(f"{i}. {rec}")
                         else:
                             st.info("No recommendations available yet")
@@ -18,14 +18,16 @@ import time
 from api_clients import (
     anthropic_client, openai_client, perplexity_client,
     dataforseo_client, keywords_everywhere_client,
-    APIResponse, get_ai_client
+    APIResponse, get_ai_client, get_http_session
 )
 
 class SEOAnalysisEngine:
     """Main engine for autonomous SEO analysis"""
 
-    def __init__(self, ai_provider: str = None):
+    def __init__(self, ai_provider: str = None, session: Optional[requests.Session] = None):
         self.ai_client = get_ai_client(ai_provider)
+        # Keep-alive connections are reused across the page, robots.txt and sitemap fetches
+        self.session = session or get_http_session()
         self.max_workers = int(os.getenv('MAX_CONCURRENT_REQUESTS', '3'))
 
     def analyze_website(self, website_url: str, analysis_type: str = "comprehensive",
@@ -73,18 +75,26 @@ class SEOAnalysisEngine:
             # Determine industry/business type from website
             industry = self._detect_industry(basic_data)
 
-            # Step 2: Parallel API calls based on analysis type
-            api_results = self._run_parallel_analysis(website_url, analysis_type, industry)
+            # Steps 2-4 are independent I/O-bound API calls, so overlap them
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Step 2: Parallel API calls based on analysis type
+                api_future = executor.submit(self._run_parallel_analysis, website_url, analysis_type, industry)
 
-            # Step 3: Collect keyword data
-            if analysis_type in ["comprehensive", "quick"]:
-                keyword_results = self._analyze_keywords(website_url, basic_data)
-                results["keyword_data"] = keyword_results
+                # Step 3: Collect keyword data
+                keyword_future = None
+                if analysis_type in ["comprehensive", "quick"]:
+                    keyword_future = executor.submit(self._analyze_keywords, website_url, basic_data)
 
-            # Step 4: Competitive analysis for comprehensive reports
-            if analysis_type == "comprehensive":
-                competitive_results = self._analyze_competition(website_url, industry)
-                results["competitive_data"] = competitive_results
+                # Step 4: Competitive analysis for comprehensive reports
+                competitive_future = None
+                if analysis_type == "comprehensive":
+                    competitive_future = executor.submit(self._analyze_competition, website_url, industry)
+
+                api_results = api_future.result()
+                if keyword_future:
+                    results["keyword_data"] = keyword_future.result()
+                if competitive_future:
+                    results["competitive_data"] = competitive_future.result()
 
             # Step 5: Compile all data and get AI analysis
             results["technical_data"].update(api_results)
@@ -128,7 +138,7 @@ class SEOAnalysisEngine:
         try:
             # Time the request
             start_time = time.time()
-            response = requests.get(website_url, timeout=10, headers={
+            response = self.session.get(website_url, timeout=10, headers={
                 'User-Agent': 'SEO-Analysis-Bot/1.0'
             })
             load_time = time.time() - start_time
@@ -167,13 +177,13 @@ class SEOAnalysisEngine:
             domain = urlparse(website_url).netloc
 
             try:
-                robots_response = requests.get(f"https://{domain}/robots.txt", timeout=5)
+                robots_response = self.session.get(f"https://{domain}/robots.txt", timeout=5)
                 data["robots_txt_exists"] = robots_response.status_code == 200
             except:
                 pass
 
             try:
-                sitemap_response = requests.get(f"https://{domain}/sitemap.xml", timeout=5)
+                sitemap_response = self.session.get(f"https://{domain}/sitemap.xml", timeout=5)
                 data["sitemap_exists"] = sitemap_response.status_code == 200
             except:
                 pass
@@ -409,7 +419,8 @@ class SEOAnalysisEngine:
 
 # Convenience function for direct usage
 def analyze_website_seo(website_url: str, analysis_type: str = "quick",
-                       client_name: str = None, ai_provider: str = None) -> Dict:
+                       client_name: str = None, ai_provider: str = None,
+                       session: Optional[requests.Session] = None) -> Dict:
     """
     Direct function to analyze website SEO
 
@@ -418,11 +429,12 @@ def analyze_website_seo(website_url: str, analysis_type: str = "quick",
         analysis_type: Type of analysis (quick, comprehensive, technical, local)
         client_name: Optional client name
         ai_provider: AI provider to use (anthropic, openai, perplexity)
+        session: Optional requests session to crawl with (defaults to the shared pool)
 
     Returns:
         Complete SEO analysis results
     """
-    engine = SEOAnalysisEngine(ai_provider)
+    engine = SEOAnalysisEngine(ai_provider, session=session)
     return engine.analyze_website(website_url, analysis_type, client_name)
 
 if __name__ == "__main__":
@@ -0,0 +1,131 @@
+import importlib
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def api_clients(tmp_path, monkeypatch):
+    # The module-level cache is created in the working directory on first import
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("api_clients")
+
+
+@pytest.fixture
+def cache(api_clients, tmp_path):
+    manager = api_clients.CacheManager(cache_dir=str(tmp_path / "test_cache"))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def waiting(api_clients, monkeypatch):
+    """Number of callers currently blocked on another caller's in-flight compute"""
+    count = [0]
+    lock = threading.Lock()
+
+    class CountingEvent(threading.Event):
+        def wait(self, timeout=None):
+            with lock:
+                count[0] += 1
+            return super().wait(timeout)
+
+    class CountingInFlight(api_clients._InFlight):
+        __slots__ = ()
+
+        def __init__(self):
+            super().__init__()
+            self.done = CountingEvent()
+
+    monkeypatch.setattr(api_clients, "_InFlight", CountingInFlight)
+    return count
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate():
+        assert time.time() < deadline, "timed out waiting for callers to block"
+        time.sleep(0.005)
+
+
+def _run_concurrently(cache, compute, callers):
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(cache.get_or_compute("key", compute))
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    return threads, results, errors
+
+
+def test_concurrent_misses_share_one_compute(cache, waiting):
+    entered, release = threading.Event(), threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        entered.set()
+        release.wait(5)
+        return {"value": 42}
+
+    threads, results, errors = _run_concurrently(cache, compute, 6)
+    threads[0].start()
+    assert entered.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    _wait_for(lambda: waiting[0] == 5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == []
+    assert len(calls) == 1
+    assert sorted(cached for _, cached in results) == [False] + [True] * 5
+    assert all(data == {"value": 42} for data, _ in results)
+    # Waiters get their own copy of the leader's result
+    assert len({id(data) for data, _ in results}) == 6
+
+
+def test_waiters_see_base_exceptions_from_the_leader(cache, waiting):
+    entered, release = threading.Event(), threading.Event()
+
+    def compute():
+        entered.set()
+        release.wait(5)
+        raise KeyboardInterrupt
+
+    threads, results, errors = _run_concurrently(cache, compute, 3)
+    threads[0].start()
+    assert entered.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    _wait_for(lambda: waiting[0] == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == []
+    assert len(errors) == 3
+    assert all(isinstance(e, KeyboardInterrupt) for e in errors)
+
+
+def test_leader_rechecks_cache_before_computing(cache, monkeypatch):
+    cache.set_by_key("key", {"value": 1})
+    get_by_key = cache.get_by_key
+    lookups = []
+
+    def racing_get_by_key(key, max_age_s=None):
+        # The first lookup misses, as if it ran just before the previous leader stored the result
+        lookups.append(key)
+        return None if len(lookups) == 1 else get_by_key(key, max_age_s)
+
+    monkeypatch.setattr(cache, "get_by_key", racing_get_by_key)
+
+    def compute():
+        raise AssertionError("compute should not run when the result is already cached")
+
+    assert cache.get_or_compute("key", compute) == ({"value": 1}, True)
@@ -0,0 +1,109 @@
+import sys
+import types
+
+import pytest
+
+import campaign_orchestrator
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    def get_cache_key(self, prefix, params):
+        return f"{prefix}:{sorted(params.items())}"
+
+    def get_by_key(self, cache_key, max_age_s=None):
+        return self.store.get(cache_key)
+
+    def set_by_key(self, cache_key, data):
+        self.store[cache_key] = data
+
+
+class FakeResearchEngine:
+    def __init__(self):
+        self.calls = []
+
+    def conduct_research(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"success": True, "subject": kwargs["target_subject"]}
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    monkeypatch.setitem(sys.modules, "api_clients", types.SimpleNamespace(cache=FakeCache()))
+    orch = campaign_orchestrator.CampaignOrchestrator.__new__(campaign_orchestrator.CampaignOrchestrator)
+    orch.research_engine = FakeResearchEngine()
+    orch.cache_stats = {"market_research": {"hits": 0, "misses": 0}}
+    return orch
+
+
+def test_market_research_falls_back_to_audience_when_industry_is_none(orchestrator):
+    config = {"industry": None, "target_audience": "Small Business Owners", "client_name": "Acme"}
+
+    result = orchestrator._run_market_research(config)
+
+    assert result == {"success": True, "subject": "Small Business Owners"}
+    assert orchestrator.research_engine.calls[0]["target_subject"] == "Small Business Owners"
+    assert orchestrator.cache_stats["market_research"] == {"hits": 0, "misses": 1}
+
+
+def test_market_research_defaults_subject_when_nothing_given(orchestrator):
+    result = orchestrator._run_market_research({"industry": None, "target_audience": None})
+
+    assert result["subject"] == "general business"
+    # Second run is served from the cache
+    orchestrator._run_market_research({"industry": None, "target_audience": None})
+    assert orchestrator.cache_stats["market_research"] == {"hits": 1, "misses": 1}
+
+
+
+class DisabledCache(FakeCache):
+    def get_by_key(self, cache_key, max_age_s=None):
+        return None
+
+    def set_by_key(self, cache_key, data):
+        pass
+
+
+@pytest.fixture
+def breakers(monkeypatch):
+    monkeypatch.setattr(campaign_orchestrator, "_BREAKERS", {})
+    monkeypatch.setitem(sys.modules, "api_clients", types.SimpleNamespace(cache=DisabledCache()))
+
+
+def _fail_phase(phase):
+    run = campaign_orchestrator.CampaignOrchestrator.__new__(campaign_orchestrator.CampaignOrchestrator)
+    future = campaign_orchestrator.concurrent.futures.Future()
+    future.set_result({"success": False, "error": "upstream down"})
+    run._await_phase(phase, future, launched=0.0)
+
+
+def _start_research():
+    fresh = campaign_orchestrator.CampaignOrchestrator.__new__(campaign_orchestrator.CampaignOrchestrator)
+    submitted = []
+    executor = types.SimpleNamespace(submit=lambda fn, *args: submitted.append(fn) or "submitted")
+    return fresh._start_phase(executor, "research", lambda: None), submitted
+
+
+def test_breaker_trips_across_orchestrators_with_caching_disabled(breakers):
+    for _ in range(campaign_orchestrator.BREAKER_THRESHOLD):
+        _fail_phase("research")
+
+    future, submitted = _start_research()
+
+    assert future.result() == {"success": False, "error": "circuit_open"}
+    assert submitted == []
+
+
+def test_breaker_forgets_failures_older_than_cooldown(breakers, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(campaign_orchestrator.time, "time", lambda: now[0])
+    for _ in range(campaign_orchestrator.BREAKER_THRESHOLD):
+        _fail_phase("research")
+        now[0] += campaign_orchestrator.BREAKER_COOLDOWN + 1
+
+    future, submitted = _start_research()
+
+    assert future == "submitted"
+    assert campaign_orchestrator._BREAKERS["research"]["failures"] == 1
@@ -0,0 +1,66 @@
+import json
+import types
+
+import pytest
+
+import client_intelligence
+
+
+class FakeAIClient:
+    def __init__(self, content):
+        self.content = content
+        self.prompts = []
+
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        return types.SimpleNamespace(success=True, data={"content": self.content})
+
+
+@pytest.fixture
+def system():
+    system = client_intelligence.ClientIntelligenceSystem(":memory:")
+    yield system
+    system.close()
+
+
+def _ai_cache_rows(system):
+    return system._conn.execute("SELECT COUNT(*) FROM ai_cache").fetchone()[0]
+
+
+def test_unparseable_ai_reply_is_not_cached(system):
+    system.ai_client = FakeAIClient("Sorry, I can't help with that.")
+
+    first = system._extract_business_intelligence({"seo_score": 40}, {}, "https://example.com")
+    second = system._extract_business_intelligence({"seo_score": 40}, {}, "https://example.com")
+
+    assert first["industry"] == "General Business"
+    assert second["industry"] == "General Business"
+    assert _ai_cache_rows(system) == 0
+    assert len(system.ai_client.prompts) == 2
+
+
+def test_parsed_ai_reply_is_cached(system):
+    system.ai_client = FakeAIClient('Here you go: {"industry": "SaaS"}')
+
+    first = system._extract_business_intelligence({"seo_score": 40}, {}, "https://example.com")
+    second = system._extract_business_intelligence({"seo_score": 40}, {}, "https://example.com")
+
+    assert first == second == {"industry": "SaaS"}
+    assert _ai_cache_rows(system) == 1
+    assert len(system.ai_client.prompts) == 1
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"a": {"b": {"c": 1}}, "d": 2}', '{"a": {"b": {"c": 1}}, "d": 2}'),
+    ('{"note": "use {braces} and }", "x": 1}', '{"note": "use {braces} and }", "x": 1}'),
+    ('{"quote": "she said \\"{hi}\\"", "y": "\\\\"}', '{"quote": "she said \\"{hi}\\"", "y": "\\\\"}'),
+    ('Sure! Here is the data:\n{"industry": "SaaS"}\nLet me know {if} you need more.', '{"industry": "SaaS"}'),
+    ('No JSON here, sorry.', None),
+    ('Unbalanced {"industry": "SaaS"', None),
+])
+def test_first_json_object(text, expected):
+    span = client_intelligence._first_json_object(text)
+
+    assert span == expected
+    if span is not None:
+        assert isinstance(json.loads(span), dict)